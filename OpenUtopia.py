@@ -13,12 +13,24 @@ options. The app aims to empower users to make informed financial decisions thro
 # Imports
 import os
 import sys
+import io
+import ast
+import re
+import sqlite3
+import json
+from collections import OrderedDict
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, simpledialog, messagebox, Toplevel, Label, Button, Scale, HORIZONTAL
 from tkinter import ttk
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import pandas as pd
 from PIL import Image, ImageTk
 import mplfinance as mpf
@@ -26,6 +38,330 @@ import xlsxwriter
 import openpyxl
 import numpy as np
 import webbrowser
+from matplotlib.colors import to_rgba
+
+# Named theme style sheets; series artists are matched to a role through their gid
+THEMES = {
+    "default": {"background": "#F5F7F8", "foreground": "#000000", "grid": "#C8CCD0", "spine": "#000000",
+                "series": "#1F77B4", "accent": "#2CA02C", "up": "#2CA02C", "down": "#D62728", "forecast": "#FF7F0E",
+                "prior": "#9467BD"},
+    "dark": {"background": "#1B1C1E", "foreground": "#FFFFFF", "grid": "#3A3C40", "spine": "#8A8D91",
+             "series": "#4FC3F7", "accent": "#81C784", "up": "#66BB6A", "down": "#EF5350", "forecast": "#FFB74D",
+             "prior": "#CE93D8"},
+    "blue": {"background": "#001F3F", "foreground": "#FFFFFF", "grid": "#1F3F66", "spine": "#7FA7D1",
+             "series": "#7FDBFF", "accent": "#FFDC00", "up": "#2ECC40", "down": "#FF851B", "forecast": "#FF4136",
+             "prior": "#F012BE"},
+    "grey": {"background": "#303030", "foreground": "#FFFFFF", "grid": "#4A4A4A", "spine": "#9E9E9E",
+             "series": "#E0E0E0", "accent": "#FFB74D", "up": "#A5D6A7", "down": "#EF9A9A", "forecast": "#90CAF9",
+             "prior": "#B39DDB"},
+}
+
+
+def style_axes(ax, style, grid_shown, previous=None):
+    """Colors the figure, axes, ticks, spines, grid and series artists of ax with a theme style.
+
+    previous is the style the artists were drawn with, used to tell rising from falling candles.
+    """
+    ax.figure.patch.set_facecolor(style["background"])
+    ax.set_facecolor(style["background"])
+    ax.tick_params(which="both", colors=style["foreground"])
+    ax.xaxis.label.set_color(style["foreground"])
+    ax.yaxis.label.set_color(style["foreground"])
+    ax.title.set_color(style["foreground"])
+    for spine in ax.spines.values():
+        spine.set_edgecolor(style["spine"])
+    if grid_shown:
+        ax.grid(True, color=style["grid"])
+    else:
+        ax.grid(False)
+
+    for artist in ax.lines + ax.patches:
+        role = artist.get_gid()
+        if role in style and hasattr(artist, "set_facecolor"):
+            artist.set_facecolor(style[role])
+        elif role in style:
+            artist.set_color(style[role])
+    for collection in ax.collections:
+        if collection.get_gid() == "candle" and previous is not None:
+            recolor_candles(collection, previous, style)
+        elif collection.get_gid() in style:
+            collection.set_facecolor(style[collection.get_gid()])
+    if ax.get_legend() is not None:
+        # Legend entries are copies of the artists, so they are rebuilt rather than recolored
+        handles = [line for line in ax.lines if line.get_gid() in ("accent", "prior") and not line.get_label().startswith("_")]
+        ax.legend(handles=handles, facecolor=style["background"], edgecolor=style["grid"], labelcolor=style["foreground"])
+
+
+def recolor_candles(collection, previous, style):
+    """Swaps the rising/falling colors of a candlestick collection."""
+    rising_before = np.array(to_rgba(previous["up"]))
+    for get_colors, set_colors in ((collection.get_facecolors, collection.set_facecolors),
+                                   (collection.get_edgecolors, collection.set_edgecolors)):
+        colors = get_colors()
+        if len(colors) <= 1:
+            continue
+        rising = np.all(np.isclose(colors[:, :3], rising_before[:3]), axis=1)
+        recolored = np.where(rising[:, None], to_rgba(style["up"]), to_rgba(style["down"]))
+        recolored[:, 3] = colors[:, 3]
+        set_colors(recolored)
+
+
+def draw_candles(ax, bars, style):
+    """Draws OHLC bars as candles in the theme's rising/falling colors."""
+    if bars is None or bars.empty:
+        return
+    candle_style = mpf.make_mpf_style(marketcolors=mpf.make_marketcolors(up=style["up"], down=style["down"], inherit=True))
+    mpf.plot(bars, type="candle", ax=ax, style=candle_style, show_nontrading=True, warn_too_much_data=len(bars) + 1)
+    for collection in ax.collections:
+        collection.set_gid("candle")
+
+
+def draw_income(ax, data, graph_type, style, candles=None):
+    """Draws income data onto ax as the given graph type; shared by the app, exports and render workers."""
+    if not data.empty:
+        if graph_type == "line":
+            data.plot(x="Period", y="Amount", ax=ax, legend=False, x_compat=True, color=style["series"], gid="series")
+        elif graph_type == "line_with_dots":
+            data.plot(x="Period", y="Amount", marker="o", ax=ax, legend=False, x_compat=True,
+                      color=style["series"], gid="series")
+        elif graph_type == "bar":
+            data.plot(kind="bar", x="Period", y="Amount", ax=ax, legend=False, color=style["series"], gid="series")
+        elif graph_type == "histogram":
+            ax.hist(data["Amount"], bins=10, color=style["series"], gid="series")
+        elif graph_type == "spline":
+            from scipy.interpolate import make_interp_spline
+            periods = np.array(data["Period"].index.values, dtype=float)
+            amounts = np.array(data["Amount"])
+            spline = make_interp_spline(periods, amounts)
+            smoothed_periods = np.linspace(periods.min(), periods.max(), 500)
+            smoothed_amounts = spline(smoothed_periods)
+            ax.plot(smoothed_periods, smoothed_amounts, color=style["accent"], gid="accent")
+        elif graph_type == "candlestick":
+            draw_candles(ax, candles, style)
+    ax.set_title("Income Data")
+    ax.set_xlabel("Period")
+    ax.set_ylabel("Amount")
+
+
+def bar_centers(ax):
+    """Returns the x centers of the series bars in axis units, in row order.
+
+    pandas places bars at row positions, period ordinals or dates depending on the version and the data's
+    frequency, so their positions are read back from the drawn artists.
+    """
+    return np.array([patch.get_x() + patch.get_width() / 2 for patch in ax.patches if patch.get_gid() == "series"])
+
+
+def draw_forecast(ax, x, forecast, style):
+    """Draws a forecast line and its confidence band past the last period.
+
+    x of None continues the spacing of the bars already drawn on ax.
+    """
+    mean, lower, upper = forecast
+    if x is None:
+        centers = bar_centers(ax)
+        step = np.median(np.diff(centers)) if len(centers) > 1 else 1.0
+        x = (centers[-1] if len(centers) else 0.0) + step * np.arange(1, len(mean) + 1)
+        # pandas fixes the x-limits of bar plots, so they are widened to take in the forecast
+        left, right = ax.get_xlim()
+        ax.set_xlim(left, max(right, x[-1] + step / 2))
+    ax.fill_between(x, lower, upper, alpha=0.2, color=style["forecast"], linewidth=0, gid="forecast")
+    ax.plot(x, mean, linestyle="--", color=style["forecast"], gid="forecast")
+
+
+def draw_comparison(ax, comparison, style):
+    """Draws per-period totals as a solid line over the aligned earlier periods as a dashed one."""
+    x, current, prior, labels = comparison
+    ax.plot(x, current, marker="o", markersize=3, color=style["accent"], gid="accent", label=labels[0])
+    ax.plot(x, prior, marker="o", markersize=3, linestyle="--", color=style["prior"], gid="prior", label=labels[1])
+    ax.legend()
+
+
+def render_worker_main(requests, results):
+    """Entry point of the render worker process.
+
+    Draws scene descriptions on an Agg figure and copies the RGBA pixels into the shared-memory frame named
+    by each scene. Requests that were overtaken by newer ones are skipped without rendering.
+    """
+    figure = Figure()
+    canvas = FigureCanvasAgg(figure)
+    blocks = {}
+
+    def attach(name):
+        if name not in blocks:
+            blocks[name] = shared_memory.SharedMemory(name=name)
+        return blocks[name]
+
+    while True:
+        request = requests.get()
+        try:
+            while request is not None:
+                request = requests.get_nowait()
+        except queue.Empty:
+            pass
+        if request is None:
+            break
+
+        sequence, scene = request
+        try:
+            width, height = scene["size"]
+            rows = scene["rows"]
+            data_block = np.ndarray((3, rows), dtype=np.float64, buffer=attach(scene["data"]).buf) if rows else None
+            if data_block is None:
+                data = pd.DataFrame(columns=["Period", "Amount"])
+            else:
+                periods = data_block[0].view(np.int64).view("datetime64[ns]") if scene["dates"] else data_block[0]
+                data = pd.DataFrame({"Period": periods, "Amount": data_block[1]}, index=data_block[2].astype(np.int64))
+
+            figure.clear()
+            figure.set_dpi(scene["dpi"])
+            figure.set_size_inches(width / scene["dpi"], height / scene["dpi"])
+            figure.subplots_adjust(**scene["margins"])
+            ax = figure.add_subplot()
+            draw_income(ax, data, scene["graph_type"], scene["style"], scene["candles"])
+            if scene["forecast"] is not None:
+                draw_forecast(ax, *scene["forecast"], scene["style"])
+            if scene["comparison"] is not None:
+                draw_comparison(ax, scene["comparison"], scene["style"])
+            if scene["xlim"] is not None:
+                ax.set_xlim(scene["xlim"])
+            style_axes(ax, scene["style"], scene["grid"])
+            canvas.draw()
+
+            pixels = np.asarray(canvas.buffer_rgba())
+            frame_height, frame_width = pixels.shape[:2]
+            frame = attach(scene["frame"])
+            np.ndarray(pixels.shape, dtype=np.uint8, buffer=frame.buf)[:] = pixels
+            results.put((sequence, frame_width, frame_height, ax.get_xlim()))
+        except Exception as e:
+            # The main process dropped a block this stale scene still referenced
+            results.put((sequence, None, None, str(e)))
+
+        for name in list(blocks):
+            if name not in (scene["data"], scene["frame"]):
+                blocks.pop(name).close()
+
+
+# Opening a CSV at least this large on a multi-core machine offers to parse it with read_csv_parallel
+PARALLEL_CSV_BYTES = 64 * 1024 * 1024
+
+
+def parse_csv_range(file_path, start, end, names):
+    """Parses the CSV rows whose first byte lies in [start, end) into typed Period and Amount arrays,
+    plus a categorical for every text column."""
+    with open(file_path, "rb") as csv_file:
+        if start > 0:
+            # Skip the rest of the line the previous range owns
+            csv_file.seek(start - 1)
+            csv_file.readline()
+        begin = csv_file.tell()
+        if begin >= end:
+            return np.array([], dtype=np.float64), np.array([], dtype=np.float64), {}
+        block = csv_file.read(end - begin)
+        if not block.endswith(b"\n"):
+            block += csv_file.readline()
+
+    # Other columns are read as text: a range whose labels all look like numbers must not be typed on its own
+    text_columns = [name for name in names if name not in ("Period", "Amount")]
+    frame = pd.read_csv(io.BytesIO(block), header=None, names=names, dtype={name: str for name in text_columns})
+    periods = frame["Period"]
+    if not pd.api.types.is_numeric_dtype(periods):
+        dates = pd.to_datetime(periods, errors="coerce")
+        if dates.isna().sum() > periods.isna().sum():
+            raise ValueError("The Period column holds values that are not dates or numbers.")
+        periods = dates
+
+    labels = {}
+    for name in text_columns:
+        values = frame[name]
+        all_numbers = pd.to_numeric(values, errors="coerce").notna().sum() == values.notna().sum()
+        labels[name] = (pd.Categorical(values), all_numbers)
+    return periods.to_numpy(), pd.to_numeric(frame["Amount"], errors="coerce").to_numpy(np.float64), labels
+
+
+def read_csv_parallel(file_path, workers=None):
+    """Reads a large CSV by parsing newline-aligned byte ranges in a process pool.
+
+    Period and Amount come back typed and text columns as categoricals; columns holding only numbers are
+    dropped, as compact_income_data would drop them. Raises ValueError when the Period column cannot be typed
+    the way compact_income_data would type it. Assumes quoted fields do not contain newlines; the results are
+    concatenated once, in file order.
+    """
+    workers = workers or os.cpu_count() or 1
+    with open(file_path, "rb") as csv_file:
+        header = csv_file.readline()
+        data_start = csv_file.tell()
+        size = os.fstat(csv_file.fileno()).st_size
+    names = pd.read_csv(io.BytesIO(header), nrows=0).columns.tolist() if header.strip() else []
+    if "Period" not in names or "Amount" not in names:
+        raise ValueError("The CSV file needs Period and Amount columns.")
+
+    # A few ranges per worker keeps every core busy when rows are unevenly spread
+    bounds = np.linspace(data_start, size, workers * 4 + 1).astype(np.int64)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        parts = list(pool.map(parse_csv_range, [file_path] * (len(bounds) - 1), bounds[:-1], bounds[1:],
+                              [names] * (len(bounds) - 1)))
+
+    parts = [part for part in parts if len(part[0])]
+    if not parts:
+        return pd.DataFrame(columns=["Period", "Amount"])
+    if len({periods.dtype.kind for periods, _, _ in parts}) > 1:
+        raise ValueError("The Period column mixes dates and numbers.")
+    columns = {"Period": np.concatenate([periods for periods, _, _ in parts]),
+               "Amount": np.concatenate([amounts for _, amounts, _ in parts])}
+    for name in names:
+        if name in ("Period", "Amount") or all(labels[name][1] for _, _, labels in parts):
+            # pd.read_csv would type a column of only numbers as numeric, and compact_income_data drops those
+            continue
+        parsed = [labels[name][0] for _, _, labels in parts if len(labels[name][0].categories)]
+        # A range where the column is entirely empty contributes missing labels
+        columns[name] = pd.api.types.union_categoricals([
+            labels[name][0] if len(labels[name][0].categories)
+            else pd.Categorical.from_codes(np.full(len(periods), -1), dtype=parsed[0].dtype)
+            for periods, _, labels in parts])
+    return pd.DataFrame(columns)
+
+
+def render_export(snapshot, file_path, file_format):
+    """Renders a graph snapshot on its own Agg figure and writes it atomically."""
+    figure = Figure(figsize=snapshot["size"], dpi=snapshot["dpi"])
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    figure.subplots_adjust(**snapshot["margins"])
+    draw_income(ax, snapshot["data"], snapshot["graph_type"], snapshot["style"], snapshot["candles"])
+    if snapshot["forecast"] is not None:
+        draw_forecast(ax, *snapshot["forecast"], snapshot["style"])
+    if snapshot["comparison"] is not None:
+        draw_comparison(ax, snapshot["comparison"], snapshot["style"])
+    if snapshot["xlim"] is not None:
+        ax.set_xlim(snapshot["xlim"])
+    if snapshot["ylim"] is not None:
+        ax.set_ylim(snapshot["ylim"])
+    style_axes(ax, snapshot["style"], snapshot["grid"])
+
+    root, extension = os.path.splitext(file_path)
+    temp_path = f"{root}.tmp{extension}"
+    figure.savefig(temp_path, format=file_format, facecolor=figure.get_facecolor())
+    os.replace(temp_path, file_path)
+    return file_path
+
+
+def write_workbook(snapshot, file_path):
+    """Writes the snapshot's income data and graph settings to an Excel file atomically."""
+    root, extension = os.path.splitext(file_path)
+    temp_path = f"{root}.tmp{extension}"
+    with pd.ExcelWriter(temp_path, engine='xlsxwriter') as writer:
+        # Save the income data
+        snapshot["data"].to_excel(writer, sheet_name="Income Data", index=False)
+
+        metadata = pd.DataFrame({
+            "Setting": ["GraphType", "Theme", "DataVersion"],
+            "Value": [snapshot["graph_type"], snapshot["theme"], snapshot["data_version"]]
+        })
+        metadata.to_excel(writer, sheet_name="Metadata", index=False)
+    os.replace(temp_path, file_path)
+    return file_path
+
 
 class OpenUtopiaFinanceApp:
     def __init__(self, root):
@@ -46,6 +382,7 @@ class OpenUtopiaFinanceApp:
 
         # Toolbar
         self.setup_toolbar()
+        self.setup_filter_bar()
 
         # Set up matplotlib figure
         self.figure, self.ax = plt.subplots()
@@ -64,6 +401,59 @@ class OpenUtopiaFinanceApp:
         self.history = []
         self.history_index = -1
 
+        # Data versions: appends bump data_version, replacing the data bumps both
+        self.data_version = 0
+        self.rewrite_version = 0
+
+        # OHLC bars for the candlestick graph, cached per interval
+        self.candle_resampler = CandleResampler()
+        self.candle_interval = "day"
+
+        # Forecast overlay, fitted on a worker thread
+        self.forecast_engine = ForecastEngine()
+        self.forecast_pool = ThreadPoolExecutor(max_workers=1)
+        self.forecast_method = None
+        self.forecast_horizon = 12
+        self.forecast_result = None
+        self.forecast_pending = None
+        self.positional_x = False
+
+        # Period-over-period overlay built from per-month or per-quarter totals
+        self.period_aggregator = PeriodAggregator()
+        self.comparison_mode = None
+
+        # Optional worker process that renders frames off the Tk thread
+        self.render_worker = None
+        self.frame_label = None
+        self.frame_image = None
+        self.worker_xlim = None
+
+        # Worker processes for saving the graph in several formats, started on first save
+        self.export_pool = None
+
+        # Row filter applied to every graph
+        self.filter_engine = FilterEngine()
+        self.active_filter = ""
+
+        # Paged data source that reloads income_data as the visible x-range changes
+        self.range_source = None
+        self.range_loaded = None
+        self.range_refresh_job = None
+
+        # Extra graph windows sharing this app's income data
+        self.graph_views = []
+        self.linking_xlim = False
+
+        # Hover tooltip and click selection, drawn by blitting over a cached background
+        self.hover_cache = None
+        self.hover_background = None
+        self.hover_annotation = None
+        self.hover_marker = None
+        self.selected_marker = None
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+        self.canvas.mpl_connect("motion_notify_event", self.on_hover)
+        self.canvas.mpl_connect("button_press_event", self.on_click)
+
          # Shortcuts storage
         self.original_shortcuts = {
             "edit_income": "<Shift-X>",
@@ -81,6 +471,8 @@ class OpenUtopiaFinanceApp:
         self.default_margins = {"left": 0.1, "right": 0.9, "top": 0.9, "bottom": 0.1}
         self.current_margins = self.default_margins.copy()
 
+        self.style_axes(self.ax)
+
     def setup_toolbar(self):
         toolbar_frame = tk.Frame(self.root)
         toolbar_frame.pack(side=tk.TOP, fill=tk.X)
@@ -116,20 +508,38 @@ class OpenUtopiaFinanceApp:
         tk.Button(toolbar_frame, image=theme_icon, command=self.change_theme).pack(side=tk.LEFT, padx=2)
         tk.Button(toolbar_frame, image=shortcuts_icon, command=self.edit_shortcuts).pack(side=tk.LEFT, padx=2)
         tk.Button(toolbar_frame, image=save_icon, command=self.save_graph).pack(side=tk.LEFT, padx=2)
+        tk.Button(toolbar_frame, text="Bulk Entry", command=self.bulk_edit_income).pack(side=tk.LEFT, padx=2)
+        tk.Button(toolbar_frame, text="New View", command=self.open_graph_view).pack(side=tk.LEFT, padx=2)
+        tk.Button(toolbar_frame, text="Forecast", command=self.edit_forecast).pack(side=tk.LEFT, padx=2)
+        tk.Button(toolbar_frame, text="Compare", command=self.edit_comparison).pack(side=tk.LEFT, padx=2)
+        tk.Button(toolbar_frame, text="Memory", command=self.show_memory_report).pack(side=tk.LEFT, padx=2)
+        tk.Button(toolbar_frame, text="Render Worker", command=self.toggle_render_worker).pack(side=tk.LEFT, padx=2)
 
         # Store references to images so they aren't garbage collected
         self.icons = [open_icon, home_icon, back_icon, forward_icon, move_icon, zoom_icon,
                 graph_icon, edit_icon, theme_icon, save_icon, grid_icon, shortcuts_icon, resize_icon]
+
+    def setup_filter_bar(self):
+        """Adds the row filter entry below the toolbar."""
+        filter_frame = tk.Frame(self.root)
+        filter_frame.pack(side=tk.TOP, fill=tk.X)
+
+        Label(filter_frame, text="Filter:").pack(side=tk.LEFT, padx=5)
+        self.filter_entry = tk.Entry(filter_frame)
+        self.filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2)
+        self.filter_entry.bind("<Return>", lambda event: self.apply_filter())
+        tk.Button(filter_frame, text="Apply", command=self.apply_filter).pack(side=tk.LEFT, padx=2)
+        tk.Button(filter_frame, text="Clear", command=self.clear_filter).pack(side=tk.LEFT, padx=2)
         
     def home_page(self):
         """Opens the home page with options."""
         home_dialog = tk.Toplevel(self.root)
         home_dialog.title("Home Page")
-        home_dialog.geometry("300x200")
+        home_dialog.geometry("300x330")
 
         def new_graph():
-            python = sys.executable
-            os.execl(python, python, *sys.argv)  # Relaunch the program
+            self.reset_workspace()
+            home_dialog.destroy()
 
         def open_website():
             webbrowser.open("https://github.com/MalekMansour/OpenUtopia-Finance")  
@@ -140,9 +550,42 @@ class OpenUtopiaFinanceApp:
         tk.Button(home_dialog, text="New Graph", command=new_graph).pack(pady=10)
         load_file_button = tk.Button(home_dialog, text="Load File", command=self.open_file)
         load_file_button.pack(pady=10)
+        tk.Button(home_dialog, text="Open Chunk Store", command=self.open_chunk_store).pack(pady=10)
+        tk.Button(home_dialog, text="Save Chunk Store", command=self.save_chunk_store).pack(pady=10)
         tk.Button(home_dialog, text="Website", command=open_website).pack(pady=10)
         tk.Button(home_dialog, text="Exit", command=home_dialog.destroy).pack(pady=10)
 
+# NEW GRAPH
+    def reset_workspace(self):
+        """Resets data, history and graph settings in-process, reusing the existing figure and canvas."""
+        self.income_data = pd.DataFrame(columns=["Period", "Amount"])
+        self.history = []
+        self.history_index = -1
+        self.graph_type = "line"
+        self.grid_shown = False
+        self.forecast_method = None
+        self.forecast_result = None
+        self.comparison_mode = None
+        self.active_filter = ""
+        self.filter_entry.delete(0, tk.END)
+        self.close_range_source()
+
+        # Leave pan/zoom mode and drop the toolbar's view stack
+        if self.nav_toolbar.mode.name == "PAN":
+            self.nav_toolbar.pan()
+        elif self.nav_toolbar.mode.name == "ZOOM":
+            self.nav_toolbar.zoom()
+        self.nav_toolbar.update()
+        self.canvas.get_tk_widget().configure(cursor="")
+
+        self.current_margins = self.default_margins.copy()
+        self.figure.subplots_adjust(**self.current_margins)
+
+        self.ax.clear()
+        self.watch_axes()
+        self.data_replaced()
+        self.apply_theme("default")
+
 # SHORTCUT BUTTON SECTION
     def bind_shortcuts(self):
         """Binds keyboard shortcuts."""
@@ -224,31 +667,28 @@ class OpenUtopiaFinanceApp:
         Button(shortcut_dialog, text="Reset", command=reset_shortcuts).grid(row=5, column=1, padx=10, pady=20)
 
 # THEMES
-    def apply_theme(self, background, foreground):
-        """Applies the theme to the plot."""
-        self.figure.patch.set_facecolor(background)
-        self.ax.set_facecolor(background)
-        self.ax.tick_params(colors=foreground)
-        self.ax.xaxis.label.set_color(foreground)
-        self.ax.yaxis.label.set_color(foreground)
-        self.ax.title.set_color(foreground)
-        self.current_theme = {"background": background, "foreground": foreground}
-        self.canvas.draw()
+    def apply_theme(self, theme):
+        """Applies a named theme by restyling the existing artists, without replotting any data."""
+        previous = THEMES[self.current_theme]
+        self.current_theme = theme
+        self.style_axes(self.ax, previous)
+        for view in self.graph_views:
+            self.style_axes(view.ax, previous)
+            view.canvas.draw_idle()
+        self.draw_canvas()
 
     def change_theme(self):
         """Switches between multiple themes."""
-        if self.current_theme == "default":
-            self.apply_theme("#1B1C1E", "#FFFFFF")  # Switch to dark theme
-            self.current_theme = "dark"
-        elif self.current_theme == "dark":
-            self.apply_theme("#001F3F", "#FFFFFF")  # Switch to blue theme
-            self.current_theme = "blue"
-        elif self.current_theme == "blue":
-            self.apply_theme("#303030", "#FFFFFF")  # Switch to grey theme
-            self.current_theme = "grey"
-        else:
-            self.apply_theme("#F5F7F8", "#000000")  # Switch back to default theme
-            self.current_theme = "default"
+        names = list(THEMES)
+        self.apply_theme(names[(names.index(self.current_theme) + 1) % len(names)])
+
+    def theme_style(self):
+        """Returns the style sheet of the current theme."""
+        return THEMES[self.current_theme]
+
+    def style_axes(self, ax, previous=None):
+        """Colors ax and its series artists with the current theme."""
+        style_axes(ax, self.theme_style(), self.grid_shown, previous)
 
 # OPEN FILE
     def open_file(self):
@@ -270,6 +710,7 @@ class OpenUtopiaFinanceApp:
         if self.history_index > 0:
             self.history_index -= 1
             self.income_data = self.history[self.history_index].copy()
+            self.data_replaced()
             self.plot_income()
 
     def go_forward(self):
@@ -277,6 +718,7 @@ class OpenUtopiaFinanceApp:
         if self.history_index < len(self.history) - 1:
             self.history_index += 1
             self.income_data = self.history[self.history_index].copy()
+            self.data_replaced()
             self.plot_income()
 
 # ENABLE MOVEMENT
@@ -295,15 +737,15 @@ class OpenUtopiaFinanceApp:
     def toggle_grid(self):
         """Toggle the grid display on the graph."""
         self.grid_shown = not self.grid_shown
-        self.ax.grid(self.grid_shown)
-        self.canvas.draw()
+        self.style_axes(self.ax)
+        self.draw_canvas()
 
 # EDIT GRAPH TYPE
     def edit_graph_type(self):
         """Opens a window to edit the graph type."""
         graph_type_dialog = Toplevel(self.root)
         graph_type_dialog.title("Edit Graph Type")
-        graph_type_dialog.geometry("300x300")
+        graph_type_dialog.geometry("300x380")
 
         Label(graph_type_dialog, text="Select Graph Type:").pack(pady=20)
 
@@ -312,12 +754,18 @@ class OpenUtopiaFinanceApp:
             self.update_graph() 
             graph_type_dialog.destroy()
 
+        def set_candlestick(interval):
+            self.candle_interval = interval
+            set_graph_type("candlestick")
+
         # Add buttons for each graph type
         Button(graph_type_dialog, text="Line Graph", command=lambda: set_graph_type("line")).pack(pady=5)
         Button(graph_type_dialog, text="Line Graph with Dots", command=lambda: set_graph_type("line_with_dots")).pack(pady=5)
         Button(graph_type_dialog, text="Bar Graph", command=lambda: set_graph_type("bar")).pack(pady=5)
         Button(graph_type_dialog, text="Histogram", command=lambda: set_graph_type("histogram")).pack(pady=5)
         Button(graph_type_dialog, text="Spline Chart", command=lambda: set_graph_type("spline")).pack(pady=5)
+        Button(graph_type_dialog, text="Candlestick (Daily)", command=lambda: set_candlestick("day")).pack(pady=5)
+        Button(graph_type_dialog, text="Candlestick (Weekly)", command=lambda: set_candlestick("week")).pack(pady=5)
 
 # GRAPH RESIZING
     def resize_graph(self):
@@ -357,7 +805,7 @@ class OpenUtopiaFinanceApp:
             self.figure.subplots_adjust(left=self.current_margins["left"], right=self.current_margins["right"],
                                     top=self.current_margins["top"], bottom=self.current_margins["bottom"])
             
-            self.canvas.draw()
+            self.draw_canvas()
 
         left_scale.bind("<Motion>", update_margins)
         right_scale.bind("<Motion>", update_margins)
@@ -370,10 +818,7 @@ class OpenUtopiaFinanceApp:
         amount = simpledialog.askfloat("Edit Income", "Enter the new income amount:")
         if amount is not None:
             new_row = pd.DataFrame({"Period": [len(self.income_data) + 1], "Amount": [amount]})
-            self.income_data = pd.concat([self.income_data, new_row], ignore_index=True)
-            self.history.append(self.income_data.copy())
-            self.history_index += 1
-            self.update_graph()
+            self.append_income(new_row)
 
     def add_income_data(self):
         """Adds income data to the graph."""
@@ -381,46 +826,142 @@ class OpenUtopiaFinanceApp:
             period = int(self.period_entry.get())
             amount = float(self.amount_entry.get())
             new_row = pd.DataFrame({"Period": [period], "Amount": [amount]})
-            self.income_data = pd.concat([self.income_data, new_row], ignore_index=True)
-            self.history.append(self.income_data.copy())
-            self.history_index += 1
-            self.update_graph()
+            self.append_income(new_row)
         except ValueError:
             messagebox.showerror("Error", "Invalid input. Please enter valid numbers.")
 
-    def plot_income(self):
-        """Plots the income data."""
-        self.ax.clear()  
-
-        if self.graph_type == "line":
-            # Line chart
-            self.ax.plot(self.income_data["Period"], self.income_data["Amount"], marker="o")
-
-        elif self.graph_type == "bar":
-            # Bar chart
-            self.ax.bar(self.income_data["Period"], self.income_data["Amount"])
-        
-        elif self.graph_type == "histogram":
-            # Histogram
-            self.ax.hist(self.income_data["Amount"], bins=10, color='blue', alpha=0.7)
-
-        elif self.graph_type == "spline":
-            # Spline (smoothed line) chart
-            x = np.arange(len(self.income_data["Period"]))
-            z = np.polyfit(x, self.income_data["Amount"], 3)
-            p = np.poly1d(z)
-            self.ax.plot(self.income_data["Period"], p(x), color='green')
+    def append_income(self, rows):
+        """Appends a batch of Period/Amount rows as one history entry and one redraw."""
+        start = len(self.income_data)
+        if self.income_data.empty:
+            self.income_data = rows.reset_index(drop=True)
+        else:
+            self.income_data = pd.concat([self.income_data, rows], ignore_index=True)
+        self.data_version += 1
+        self.history.append(self.income_data.copy())
+        self.history_index += 1
+        self.update_graph()
+        for view in self.graph_views:
+            view.extend(start)
+
+# BULK DATA ENTRY
+    def bulk_edit_income(self):
+        """Opens a grid for pasting or typing many Period/Amount rows at once."""
+        bulk_dialog = Toplevel(self.root)
+        bulk_dialog.title("Bulk Data Entry")
+        bulk_dialog.geometry("420x480")
+
+        Label(bulk_dialog, text="Paste Period/Amount rows (tab or comma separated):").pack(pady=5)
+        grid_text = tk.Text(bulk_dialog, width=45, height=20, undo=True)
+        grid_text.pack(padx=10, fill=tk.BOTH, expand=True)
+        grid_text.tag_configure("error", background="#F8D7DA", foreground="#721C24")
+
+        status_label = Label(bulk_dialog, text="")
+        status_label.pack(pady=5)
+
+        def paste_clipboard():
+            try:
+                grid_text.insert(tk.INSERT, self.root.clipboard_get())
+            except tk.TclError:
+                messagebox.showerror("Error", "The clipboard is empty.", parent=bulk_dialog)
+
+        def validate():
+            """Highlights every invalid cell and returns the parsed rows."""
+            grid_text.tag_remove("error", "1.0", tk.END)
+            rows, bad_cells = self.parse_income_block(grid_text.get("1.0", "end-1c"))
+            for line, start, end in bad_cells:
+                grid_text.tag_add("error", f"{line}.{start}", f"{line}.{end}")
+            status_label.config(text=f"{len(rows)} valid rows, {len(bad_cells)} invalid cells")
+            return rows, bad_cells
+
+        def add_rows():
+            rows, bad_cells = validate()
+            if bad_cells:
+                messagebox.showerror("Error", "Fix the highlighted cells before adding.", parent=bulk_dialog)
+            elif not rows.empty:
+                self.append_income(rows)
+                bulk_dialog.destroy()
+
+        button_frame = tk.Frame(bulk_dialog)
+        button_frame.pack(pady=10)
+        Button(button_frame, text="Paste", command=paste_clipboard).pack(side=tk.LEFT, padx=5)
+        Button(button_frame, text="Validate", command=validate).pack(side=tk.LEFT, padx=5)
+        Button(button_frame, text="Add Rows", command=add_rows).pack(side=tk.LEFT, padx=5)
+
+    def parse_income_block(self, text):
+        """Parses a TSV/CSV block of Period/Amount rows, validating every cell in one vectorized pass.
+
+        Returns the valid rows and a list of (line, start column, end column) spans for invalid cells.
+        Rows holding a single value are treated as amounts and numbered after the existing periods.
+        """
+        lines = pd.Series(text.split("\n"))
+        lines = lines[lines.str.strip() != ""]
+        if not lines.empty and lines.iloc[0].strip().lower().startswith(("period", "date", "amount")):
+            lines = lines.iloc[1:]
+        if lines.empty:
+            return pd.DataFrame(columns=["Period", "Amount"]), []
+
+        sep = "\t" if lines.str.contains("\t", regex=False).any() else ","
+        cells = lines.str.split(sep, n=1, expand=True)
+        if cells.shape[1] == 1:
+            cells[1] = None
+        if sep == ",":
+            # A lone amount with thousands separators ("$1,234.50") is one cell, not a period and an amount
+            lone_amount = lines.str.strip().str.fullmatch(r"[-+]?[$€£]\s?[-+]?\d{1,3}(,\d{3})+(\.\d+)?")
+            cells[0] = cells[0].where(~lone_amount, lines)
+            cells[1] = cells[1].where(~lone_amount, None)
+        single = cells[1].isna()
+        period_text = cells[0].where(~single, "").str.strip()
+        amount_text = cells[1].where(~single, cells[0]).str.strip().str.replace(r"[$€£\s]", "", regex=True)
+        if sep == "\t":
+            amount_text = amount_text.str.replace(",", "", regex=False)
+        else:
+            amount_text = amount_text.str.replace(r"(?<=\d),(?=\d{3}(\D|$))", "", regex=True)
 
-        # General configuration
-        self.ax.set_title("Income Data")
-        self.ax.set_xlabel("Period")
-        self.ax.set_ylabel("Amount")
+        amounts = pd.to_numeric(amount_text, errors="coerce")
+        bad_amount = amounts.isna()
 
-        # Rotate date labels if using datetime for Period
-        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        plt.xticks(rotation=45)
+        # Periods follow the type already in the graph: numbers by default, dates once any date is involved
+        existing = self.income_data["Period"]
+        given = period_text != ""
+        numeric_periods = pd.to_numeric(period_text, errors="coerce")
+        if existing.empty:
+            use_dates = given.any() and numeric_periods[given].isna().mean() > 0.5
+        else:
+            use_dates = pd.api.types.is_string_dtype(existing) or pd.api.types.is_datetime64_any_dtype(existing)
+        if use_dates:
+            periods = pd.to_datetime(period_text, errors="coerce")
+            bad_period = periods.isna()
+            if pd.api.types.is_string_dtype(existing) and not existing.empty:
+                periods = period_text
+        else:
+            auto_numbers = len(self.income_data) + np.cumsum(~given.to_numpy())
+            periods = numeric_periods.where(given, pd.Series(auto_numbers, index=lines.index))
+            bad_period = periods.isna()
+
+        # Cell spans within each Text widget line, used for highlighting
+        period_end = cells[0].str.len().where(~single, 0)
+        line_end = lines.str.len()
+        bad_cells = []
+        for index in np.flatnonzero(bad_period.to_numpy()):
+            row = int(lines.index[index])
+            bad_cells.append((row + 1, 0, int(period_end[row]) or int(line_end[row])))
+        for index in np.flatnonzero(bad_amount.to_numpy()):
+            row = int(lines.index[index])
+            start = int(period_end[row]) + 1 if not single[row] else 0
+            bad_cells.append((row + 1, start, int(line_end[row])))
+
+        valid = ~(bad_period | bad_amount)
+        periods = periods[valid]
+        if not use_dates and (periods % 1 == 0).all():
+            periods = periods.astype("int64")
+        rows = pd.DataFrame({"Period": periods, "Amount": amounts[valid]})
+        return rows, bad_cells
 
-        self.canvas.draw()  
+    def plot_income(self):
+        """Plots the income data through draw_income, so exports and the render worker draw the same graph
+        in the same axis units."""
+        self.update_graph()
 
 # Resize Icons
     def resize_icon(self, path, size):
@@ -431,44 +972,97 @@ class OpenUtopiaFinanceApp:
     
 # Save Graph to Excel File
     def save_graph(self):
-        """Save the income data and graph settings to an Excel file."""
+        """Save the income data, graph settings and PNG/SVG/PDF images of the graph."""
         file_path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel Files", "*.xlsx")])
         if file_path:
-            try:
-                # Create an Excel writer
-                with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
-                    # Save the income data
-                    self.income_data.to_excel(writer, sheet_name="Income Data", index=False)
-                
-                    metadata = pd.DataFrame({
-                        "Setting": ["GraphType", "Theme"],
-                        "Value": [self.graph_type, self.current_theme]
-                    })
-                    metadata.to_excel(writer, sheet_name="Metadata", index=False)
-                
-                messagebox.showinfo("Success", "Data saved successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save file: {e}")
+            self.export_graph(os.path.splitext(file_path)[0])
+
+    def graph_snapshot(self):
+        """Captures the data and figure state an export needs.
+
+        income_data is replaced rather than modified in place, so holding a reference is a stable snapshot.
+        In render-worker mode the hidden axes are stale, so the worker's x-range is used and y is autoscaled.
+        """
+        data = self.plot_frame()
+        if self.render_worker is not None:
+            xlim, ylim = self.worker_xlim, None
+        else:
+            xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
+        return {
+            "data": data,
+            "data_version": self.data_version,
+            "graph_type": self.graph_type,
+            "candles": self.candle_bars(data) if self.graph_type == "candlestick" else None,
+            "forecast": self.forecast_overlay(data),
+            "comparison": self.comparison_overlay(data),
+            "theme": self.current_theme,
+            "style": dict(self.theme_style()),
+            "grid": self.grid_shown,
+            "margins": self.current_margins.copy(),
+            "xlim": xlim,
+            "ylim": ylim,
+            "size": tuple(self.figure.get_size_inches()),
+            "dpi": self.figure.dpi,
+        }
+
+    def export_graph(self, base_path):
+        """Writes the data workbook and every image format in the background, then reports the result."""
+        snapshot = self.graph_snapshot()
+        if self.export_pool is None:
+            # Separate processes keep pandas' and matplotlib's global plotting state out of each other's way
+            self.export_pool = ProcessPoolExecutor(max_workers=4, mp_context=multiprocessing.get_context("spawn"))
+        futures = [self.export_pool.submit(write_workbook, snapshot, base_path + ".xlsx")]
+        for file_format in ("png", "svg", "pdf"):
+            futures.append(self.export_pool.submit(render_export, snapshot, f"{base_path}.{file_format}", file_format))
+
+        def check_exports():
+            if not all(future.done() for future in futures):
+                self.root.after(100, check_exports)
+                return
+            errors = [str(future.exception()) for future in futures if future.exception() is not None]
+            if errors:
+                messagebox.showerror("Error", "Failed to save file:\n" + "\n".join(errors))
+            else:
+                saved = "\n".join(os.path.basename(future.result()) for future in futures)
+                messagebox.showinfo("Success", f"Data and graph saved successfully!\n{saved}")
+
+        self.root.after(100, check_exports)
 
 # Import Excel File
     def open_file(self):
         """Handles the action of opening a file (supports CSV and Excel files)."""
         file_path = filedialog.askopenfilename(
             title="Open Income Data",
-            filetypes=[("All Files", "*.*"), ("Excel Files", "*.xlsx;*.xls"), ("CSV Files", "*.csv")]
+            filetypes=[("All Files", "*.*"), ("Excel Files", "*.xlsx;*.xls"), ("CSV Files", "*.csv"),
+                       ("SQLite Ledger", "*.db;*.sqlite;*.sqlite3")]
         )
     
         if file_path:
             try:
+                # SQLite ledgers are paged in by visible range rather than loaded whole
+                if file_path.endswith(('.db', '.sqlite', '.sqlite3')):
+                    self.open_sqlite_ledger(file_path)
+                    return
+                self.close_range_source()
+
                 # Check the file extension to determine how to load the file
                 if file_path.endswith('.xlsx') or file_path.endswith('.xls'):
                     self.income_data = pd.read_excel(file_path)
+                elif file_path.endswith('.csv') and self.ask_parallel_csv(file_path):
+                    # Large CSVs are split into byte ranges and parsed on every core
+                    try:
+                        self.income_data = read_csv_parallel(file_path)
+                    except ValueError:
+                        # Periods that are neither all dates nor all numbers stay text on the regular path
+                        self.income_data = pd.read_csv(file_path)
                 elif file_path.endswith('.csv'):
                     self.income_data = pd.read_csv(file_path)
                 else:
                     raise ValueError("Unsupported file format. Please open CSV or Excel files.")
+                self.income_data = self.compact_income_data(self.income_data)
             
                 # Plot the income data after successful loading
+                self.data_replaced()
                 self.plot_income()
             
                 # Append the current data to history for back/forward navigation
@@ -478,34 +1072,1406 @@ class OpenUtopiaFinanceApp:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load file: {e}")
 
+    def ask_parallel_csv(self, file_path):
+        """Offers to parse a large CSV on every core; small files and single-core machines use pd.read_csv."""
+        cores = os.cpu_count() or 1
+        size = os.path.getsize(file_path)
+        if cores < 2 or size < PARALLEL_CSV_BYTES:
+            return False
+        return messagebox.askyesno("Open Income Data", f"This CSV is {self.format_bytes(size)}. Parse it on all {cores} cores?")
+
+# RANGE-DRIVEN LOADING
+    def open_sqlite_ledger(self, file_path):
+        """Opens a table of a SQLite ledger as a paged range source."""
+        tables = SQLiteLedgerSource.tables(file_path)
+        if not tables:
+            raise ValueError("The database has no tables.")
+        table = tables[0]
+        if len(tables) > 1:
+            table = simpledialog.askstring("Open Ledger", f"Table to load ({', '.join(tables)}):", initialvalue=table)
+            if not table:
+                return
+
+        self.close_range_source()
+        self.range_source = SQLiteLedgerSource(file_path, table)
+        self.load_range(*self.range_source.initial_range())
+
+    def open_chunk_store(self):
+        """Opens a chunked on-disk store as a range source."""
+        directory = filedialog.askdirectory(title="Open Chunk Store")
+        if directory:
+            try:
+                store = ChunkedStore(directory)
+                self.close_range_source()
+                self.range_source = store
+                self.load_range(*store.initial_range())
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to open chunk store: {e}")
+
+    def save_chunk_store(self):
+        """Writes the current income data into a chunked on-disk store."""
+        directory = filedialog.askdirectory(title="Save Chunk Store")
+        if directory:
+            try:
+                ChunkedStore.write(directory, self.income_data)
+                messagebox.showinfo("Success", "Chunk store saved successfully!")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to save chunk store: {e}")
+
+    def close_range_source(self):
+        """Stops reloading data from the current range source."""
+        if self.range_refresh_job is not None:
+            self.root.after_cancel(self.range_refresh_job)
+            self.range_refresh_job = None
+        self.range_source = None
+        self.range_loaded = None
+
+    def load_range(self, low, high, keep_view=False, visible=None):
+        """Replaces income_data with the source rows between low and high.
+
+        The level of detail follows the visible range, which defaults to the whole loaded range.
+        """
+        level = self.range_source.level(*(visible or (low, high)))
+        data, complete = self.range_source.fetch(low, high, level)
+        self.income_data = self.compact_income_data(data)
+        if not complete and not data.empty:
+            # The row cap was reached, so only part of the range is resident
+            high = self.range_source.to_period(data["Period"].iloc[-1])
+        self.range_loaded = (low, high, level)
+        self.data_replaced()
+
+        view = self.ax.get_xlim()
+        self.plot_income()
+        if keep_view:
+            self.ax.set_xlim(view)
+            self.canvas.draw_idle()
+
+    def schedule_range_refresh(self):
+        """Debounces range reloads while the user is still panning or zooming."""
+        if self.range_refresh_job is not None:
+            self.root.after_cancel(self.range_refresh_job)
+        self.range_refresh_job = self.root.after(200, self.refresh_range)
+
+    def refresh_range(self):
+        """Loads the visible x-range plus a prefetch margin unless it is already resident."""
+        self.range_refresh_job = None
+        if self.range_source is None:
+            return
+        low, high = (self.range_source.to_period(self.axis_to_period(x)) for x in self.ax.get_xlim())
+        if self.range_loaded is not None and self.range_source.covers(self.range_loaded, low, high):
+            return
+        margin = (high - low) * self.range_source.PREFETCH
+        self.load_range(low - margin, high + margin, keep_view=True, visible=(low, high))
+
+    def axis_to_period(self, x):
+        """Converts an x-axis coordinate back into a Period value."""
+        if self.range_source.kind == "date":
+            return pd.Timestamp(mdates.num2date(x)).tz_localize(None)
+        return x
+
+# CANDLESTICK
+    def candle_bars(self, data):
+        """Returns the data resampled to OHLC bars for the current interval, or None if it has no dates."""
+        try:
+            return self.candle_resampler.resample(data, (self.candle_interval, self.active_filter),
+                                                  self.data_version, self.rewrite_version)
+        except ValueError as e:
+            messagebox.showerror("Error", f"Cannot draw candlesticks: {e}")
+            return None
+
+# FORECASTING
+    def edit_forecast(self):
+        """Opens a window to choose the forecast model and horizon."""
+        forecast_dialog = Toplevel(self.root)
+        forecast_dialog.title("Forecast")
+        forecast_dialog.geometry("300x300")
+
+        Label(forecast_dialog, text="Periods Ahead:").pack(pady=10)
+        horizon_scale = Scale(forecast_dialog, from_=1, to=60, orient=HORIZONTAL)
+        horizon_scale.set(self.forecast_horizon)
+        horizon_scale.pack()
+
+        def set_forecast(method):
+            self.forecast_method = method
+            self.forecast_horizon = horizon_scale.get()
+            self.update_graph()
+            forecast_dialog.destroy()
+
+        Button(forecast_dialog, text="Linear Trend", command=lambda: set_forecast("linear")).pack(pady=5)
+        Button(forecast_dialog, text="Holt-Winters", command=lambda: set_forecast("holt_winters")).pack(pady=5)
+        Button(forecast_dialog, text="No Forecast", command=lambda: set_forecast(None)).pack(pady=5)
+
+    def show_forecast(self, data):
+        """Draws the forecast overlay on the main graph if it is ready."""
+        forecast = self.forecast_overlay(data)
+        if forecast is not None:
+            draw_forecast(self.ax, *forecast, self.theme_style())
+
+    def forecast_overlay(self, data):
+        """Returns the forecast x positions and (mean, lower, upper) arrays if the fit for the current graph is
+        ready, otherwise starts fitting it on the worker thread and returns None."""
+        if self.forecast_method is None or self.graph_type == "histogram" or len(data) < 3:
+            return None
+        key = (self.forecast_method, self.forecast_horizon, self.active_filter, self.data_version)
+        if self.forecast_result is not None and self.forecast_result[0] == key:
+            return self.forecast_x(data), self.forecast_result[1]
+        if self.forecast_pending == key:
+            return None
+
+        amounts = data["Amount"].to_numpy(np.float64)
+        future = self.forecast_pool.submit(
+            self.forecast_engine.forecast, (self.forecast_method, self.active_filter), self.forecast_method, amounts,
+            self.season_length(data), self.data_version, self.rewrite_version, self.forecast_horizon)
+        self.forecast_pending = key
+
+        def check_forecast():
+            if not future.done():
+                self.root.after(50, check_forecast)
+                return
+            if self.forecast_pending == key:
+                self.forecast_pending = None
+            if future.exception() is not None:
+                messagebox.showerror("Error", f"Forecast failed: {future.exception()}")
+                return
+            current = (self.forecast_method, self.forecast_horizon, self.active_filter, self.data_version)
+            if current == key:
+                self.forecast_result = (key, future.result())
+                if self.render_worker is not None:
+                    self.request_frame()
+                else:
+                    # Still the graph on screen, so the overlay can be added without a replot
+                    self.show_forecast(self.plot_frame())
+                    self.canvas.draw_idle()
+
+        self.root.after(50, check_forecast)
+        return None
+
+    def forecast_x(self, data):
+        """Returns the x positions of the forecast periods in the current graph's axis units, or None for bar
+        graphs, whose forecast is placed from the drawn bars."""
+        steps = np.arange(1, self.forecast_horizon + 1)
+        if self.graph_type == "bar":
+            return None
+        if self.positional_x:
+            return data.index[-1] + steps
+        periods = data["Period"]
+        if pd.api.types.is_datetime64_any_dtype(periods):
+            step = periods.diff().median()
+            return mdates.date2num(periods.iloc[-1] + step * steps)
+        step = np.median(np.diff(periods.to_numpy(np.float64)))
+        return float(periods.iloc[-1]) + step * steps
+
+    def season_length(self, data):
+        """Guesses the seasonal cycle from the spacing of the periods."""
+        periods = data["Period"]
+        if not pd.api.types.is_datetime64_any_dtype(periods):
+            return 12
+        days = periods.diff().median() / pd.Timedelta(days=1)
+        for spacing, season in ((1, 7), (7, 52), (30.4, 12), (91.3, 4)):
+            if abs(days - spacing) <= spacing * 0.2:
+                return season
+        return 1
+
+# PERIOD COMPARISON
+    def edit_comparison(self):
+        """Opens a window to choose which earlier periods are overlaid on the graph."""
+        comparison_dialog = Toplevel(self.root)
+        comparison_dialog.title("Compare Periods")
+        comparison_dialog.geometry("300x220")
+
+        Label(comparison_dialog, text="Compare Each Period With:").pack(pady=10)
+
+        def set_comparison(mode):
+            self.comparison_mode = mode
+            self.update_graph()
+            comparison_dialog.destroy()
+
+        Button(comparison_dialog, text="Year over Year", command=lambda: set_comparison("yoy")).pack(pady=5)
+        Button(comparison_dialog, text="Quarter over Quarter", command=lambda: set_comparison("qoq")).pack(pady=5)
+        Button(comparison_dialog, text="Month over Month", command=lambda: set_comparison("mom")).pack(pady=5)
+        Button(comparison_dialog, text="No Comparison", command=lambda: set_comparison(None)).pack(pady=5)
+
+    def comparison_overlay(self, data):
+        """Returns the x positions, totals and earlier totals to overlay, or None when nothing is compared.
+
+        Bar and spline graphs are drawn at row positions rather than dates, so they get no overlay.
+        """
+        if self.comparison_mode is None or self.positional_x or self.graph_type == "histogram" or data.empty:
+            return None
+        grouping, lag, labels = PeriodAggregator.MODES[self.comparison_mode]
+        try:
+            groups = self.period_aggregator.aggregate(data, (grouping, self.active_filter),
+                                                      self.data_version, self.rewrite_version)
+        except ValueError as e:
+            self.comparison_mode = None
+            messagebox.showerror("Error", f"Cannot compare periods: {e}")
+            return None
+        current, prior = self.period_aggregator.compare(groups, lag)
+        return mdates.date2num(groups.index.to_timestamp()), current, prior, labels
+
+    def show_comparison(self, data):
+        """Draws the period-over-period overlay on the main graph."""
+        comparison = self.comparison_overlay(data)
+        if comparison is not None:
+            draw_comparison(self.ax, comparison, self.theme_style())
+
+# COMPACT DATA
+    def compact_income_data(self, data):
+        """Downcasts loaded data to the narrowest safe dtypes and drops columns the app never uses."""
+        compact = {}
+        for name in data.columns:
+            column = data[name]
+            if name == "Period":
+                compact[name] = self.compact_periods(column)
+            elif name == "Amount":
+                compact[name] = self.compact_amounts(column)
+            elif pd.api.types.is_string_dtype(column) or isinstance(column.dtype, pd.CategoricalDtype):
+                # Low-cardinality labels stay available to the filter bar as categoricals
+                if column.nunique() <= len(column) // 2:
+                    compact[name] = column.astype("category")
+        return pd.DataFrame(compact)
+
+    def compact_periods(self, periods):
+        """Stores periods as int32 numbers or datetime64 dates where the values allow it."""
+        if pd.api.types.is_string_dtype(periods):
+            dates = pd.to_datetime(periods, errors="coerce")
+            if dates.notna().sum() == periods.notna().sum():
+                return dates
+            return periods
+        if pd.api.types.is_numeric_dtype(periods) and periods.notna().all() and (periods % 1 == 0).all():
+            info = np.iinfo(np.int32)
+            if periods.empty or (periods.min() >= info.min and periods.max() <= info.max):
+                return periods.astype(np.int32)
+        return periods
+
+    def compact_amounts(self, amounts):
+        """Stores amounts as float32 when every value still rounds to the same cent."""
+        amounts = pd.to_numeric(amounts, errors="coerce").astype(np.float64)
+        narrow = amounts.astype(np.float32)
+        if np.array_equal(np.round(narrow.to_numpy(np.float64), 2), np.round(amounts.to_numpy(), 2), equal_nan=True):
+            return narrow
+        return amounts
+
+# MEMORY REPORT
+    def memory_report(self):
+        """Returns (label, bytes) pairs for the data, history, caches and figures."""
+        width, height = self.canvas.get_width_height()
+        figure_bytes = width * height * 4
+        for view in self.graph_views:
+            view_width, view_height = view.canvas.get_width_height()
+            figure_bytes += view_width * view_height * 4
+
+        hover_bytes = 0
+        if self.hover_cache is not None:
+            points = self.hover_cache[1]
+            hover_bytes = sum(value.nbytes for value in points.values() if isinstance(value, np.ndarray))
+            if "data" in points and points["data"] is not self.income_data:
+                # A filtered copy of the rows, not a reference to income_data
+                hover_bytes += int(points["data"].memory_usage(deep=True).sum())
+
+        # The forecast thread adds models while this runs, so iterate over a snapshot
+        forecast_bytes = sum(value.nbytes if isinstance(value, np.ndarray) else 8
+                             for _, _, state in list(self.forecast_engine.models.values()) for value in state.values())
+        if self.forecast_result is not None:
+            forecast_bytes += sum(values.nbytes for values in self.forecast_result[1])
+
+        return [
+            ("Income data", int(self.income_data.memory_usage(deep=True).sum())),
+            ("History", int(sum(state.memory_usage(deep=True).sum() for state in self.history))),
+            ("Filter masks", sum(mask.nbytes for _, _, mask in self.filter_engine.masks.values())),
+            ("Hover points", hover_bytes),
+            ("Candle bars", int(sum(bars.memory_usage(deep=True).sum()
+                                    for _, _, _, bars in self.candle_resampler.cache.values()))),
+            ("Period totals", int(sum(groups.memory_usage(deep=True).sum()
+                                      for _, _, groups in self.period_aggregator.cache.values()))),
+            ("Forecast models", forecast_bytes),
+            ("Figure buffers", figure_bytes),
+        ]
+
+    def show_memory_report(self):
+        """Opens a panel listing the memory used by the app."""
+        memory_dialog = Toplevel(self.root)
+        memory_dialog.title("Memory Usage")
+        memory_dialog.geometry("300x370")
+
+        report_frame = tk.Frame(memory_dialog)
+        report_frame.pack(pady=10)
+
+        def refresh():
+            for widget in report_frame.winfo_children():
+                widget.destroy()
+            report = self.memory_report()
+            report.append(("Total", sum(size for _, size in report)))
+            for row, (label, size) in enumerate(report):
+                Label(report_frame, text=f"{label}:").grid(row=row, column=0, sticky="w", padx=10, pady=2)
+                Label(report_frame, text=self.format_bytes(size)).grid(row=row, column=1, sticky="e", padx=10, pady=2)
+
+        refresh()
+        Button(memory_dialog, text="Refresh", command=refresh).pack(pady=10)
+
+    def format_bytes(self, size):
+        """Formats a byte count for display."""
+        for unit in ("B", "KB", "MB"):
+            if size < 1024:
+                return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} GB"
+
 # UPDATE GRAPH 
     def update_graph(self):
         """Updates the graph with the current income data."""
+        if self.render_worker is not None:
+            self.request_frame()
+            return
         self.ax.clear()
-        if not self.income_data.empty:
+        data = self.plot_frame()
+        candles = self.candle_bars(data) if self.graph_type == "candlestick" else None
+        draw_income(self.ax, data, self.graph_type, self.theme_style(), candles)
+        self.positional_x = self.graph_type in ("bar", "spline")
+        self.show_forecast(data)
+        self.show_comparison(data)
+        self.style_axes(self.ax)
+        self.watch_axes()
+        self.canvas.draw()
+
+# FILTERING
+    def apply_filter(self):
+        """Compiles the filter bar expression and replots through its mask."""
+        expression = self.filter_entry.get().strip()
+        if expression:
+            try:
+                self.filter_engine.mask(expression, self.income_data, self.data_version, self.rewrite_version)
+            except Exception as e:
+                messagebox.showerror("Error", f"Invalid filter: {e}")
+                return
+        self.active_filter = expression
+        self.update_graph()
+        for view in self.graph_views:
+            view.redraw()
+
+    def clear_filter(self):
+        """Removes the active filter."""
+        self.filter_entry.delete(0, tk.END)
+        self.apply_filter()
+
+    def filter_mask(self):
+        """Returns the boolean row mask of the active filter, or None when nothing is filtered."""
+        if not self.active_filter:
+            return None
+        return self.filter_engine.mask(self.active_filter, self.income_data, self.data_version, self.rewrite_version)
+
+    def plot_frame(self):
+        """Returns the rows of income_data the graphs should draw."""
+        mask = self.filter_mask()
+        if mask is None:
+            return self.income_data
+        return self.income_data[mask]
+
+# RENDER WORKER
+    def toggle_render_worker(self):
+        """Switches between drawing on the Tk thread and drawing in a separate render process."""
+        if self.render_worker is None:
+            self.render_worker = RenderWorker()
+            self.canvas.get_tk_widget().pack_forget()
+            self.nav_toolbar.pack_forget()
+            self.frame_label = tk.Label(self.root, background=self.theme_style()["background"])
+            self.frame_label.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+            self.frame_label.bind("<Configure>", lambda event: self.request_frame())
+            self.frame_label.bind("<MouseWheel>", lambda event: self.zoom_frame(event, event.delta > 0))
+            self.frame_label.bind("<Button-4>", lambda event: self.zoom_frame(event, True))
+            self.frame_label.bind("<Button-5>", lambda event: self.zoom_frame(event, False))
+            self.worker_xlim = None
+            self.poll_frames()
+        else:
+            self.render_worker.close()
+            self.render_worker = None
+            self.frame_label.destroy()
+            self.frame_label = None
+            self.frame_image = None
+            self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+            self.nav_toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+            self.update_graph()
+
+    def draw_canvas(self):
+        """Redraws the graph on whichever side is rendering it."""
+        if self.render_worker is not None:
+            self.request_frame()
+        else:
+            self.canvas.draw_idle()
+
+    def request_frame(self):
+        """Sends a description of the current graph to the render worker."""
+        width, height = self.frame_label.winfo_width(), self.frame_label.winfo_height()
+        if width < 2 or height < 2:
+            return
+        data = self.plot_frame()
+        self.positional_x = self.graph_type in ("bar", "spline")
+        scene = {
+            "size": (width, height),
+            "dpi": self.figure.dpi,
+            "graph_type": self.graph_type,
+            "candles": self.candle_bars(data) if self.graph_type == "candlestick" else None,
+            "forecast": self.forecast_overlay(data),
+            "comparison": self.comparison_overlay(data),
+            "style": dict(self.theme_style()),
+            "grid": self.grid_shown,
+            "margins": self.current_margins.copy(),
+            "xlim": self.worker_xlim,
+        }
+        self.render_worker.submit(scene, data, (self.data_version, self.active_filter))
+
+    def poll_frames(self):
+        """Blits the newest finished frame into the window; input handling is all the Tk thread does."""
+        if self.render_worker is None:
+            return
+        frame = self.render_worker.latest_frame()
+        if frame is not None:
+            width, height, pixels, self.worker_xlim = frame
+            image = Image.frombuffer("RGBA", (width, height), pixels, "raw", "RGBA", 0, 1)
+            self.frame_image = ImageTk.PhotoImage(image)
+            self.frame_label.configure(image=self.frame_image)
+        self.root.after(15, self.poll_frames)
+
+    def zoom_frame(self, event, zoom_in):
+        """Zooms the worker-rendered graph around the mouse position."""
+        if self.worker_xlim is None:
+            return
+        width = self.frame_label.winfo_width()
+        left, right = self.current_margins["left"], self.current_margins["right"]
+        fraction = min(max((event.x / width - left) / (right - left), 0), 1)
+        x0, x1 = self.worker_xlim
+        center = x0 + fraction * (x1 - x0)
+        scale = 0.8 if zoom_in else 1.25
+        self.worker_xlim = (center - (center - x0) * scale, center + (x1 - center) * scale)
+        self.request_frame()
+
+# HOVER AND PICKING
+    def hover_points(self):
+        """Returns the full-resolution plotted points sorted by x in axis units, cached per data version."""
+        key = (self.data_version, self.active_filter, self.graph_type, self.positional_x)
+        if self.hover_cache is not None and self.hover_cache[0] == key:
+            return self.hover_cache[1]
+
+        data = self.plot_frame()
+        amounts = data["Amount"].to_numpy(np.float64)
+        if self.graph_type == "histogram":
+            counts, edges = np.histogram(amounts, bins=10) if len(amounts) else (np.array([]), np.array([]))
+            points = {"edges": edges, "counts": counts}
+        else:
+            periods = data["Period"]
+            centers = bar_centers(self.ax) if self.graph_type == "bar" else None
+            if centers is not None and len(centers) == len(data):
+                # Bars sit wherever pandas put them for this data, so their drawn positions are used
+                x = centers
+            elif self.positional_x and self.graph_type == "spline":
+                x = data.index.to_numpy(np.float64)
+            elif self.positional_x or not (pd.api.types.is_numeric_dtype(periods) or
+                                           pd.api.types.is_datetime64_any_dtype(periods)):
+                x = np.arange(len(data), dtype=np.float64)
+            elif pd.api.types.is_datetime64_any_dtype(periods):
+                x = mdates.date2num(periods.to_numpy())
+            else:
+                x = periods.to_numpy(np.float64)
+            order = np.argsort(x, kind="stable")
+            points = {"x": x[order], "y": amounts[order], "rows": order, "data": data}
+
+        self.hover_cache = (key, points)
+        return points
+
+    def nearest_point(self, event):
+        """Finds the data point nearest the mouse with a binary search on the sorted x values."""
+        points = self.hover_points()
+        if self.graph_type == "histogram":
+            edges = points["edges"]
+            bin_index = np.searchsorted(edges, event.xdata, side="right") - 1
+            if not len(edges) or bin_index < 0 or bin_index >= len(points["counts"]):
+                return None
+            x = (edges[bin_index] + edges[bin_index + 1]) / 2
+            count = points["counts"][bin_index]
+            return x, count, f"Amount {edges[bin_index]:,.2f} to {edges[bin_index + 1]:,.2f}\nCount: {count}"
+
+        xs = points["x"]
+        if not len(xs):
+            return None
+        right = min(np.searchsorted(xs, event.xdata), len(xs) - 1)
+        index = right - 1 if right > 0 and event.xdata - xs[right - 1] < xs[right] - event.xdata else right
+        x, y = xs[index], points["y"][index]
+        if abs(self.ax.transData.transform((x, y))[0] - event.x) > 30:  # pixels
+            return None
+        period = points["data"]["Period"].iloc[points["rows"][index]]
+        return x, y, f"Period: {period}\nAmount: {y:,.2f}"
+
+    def ensure_hover_artists(self):
+        """Creates the animated tooltip and markers, which ax.clear() removes."""
+        if self.hover_annotation is not None and self.hover_annotation in self.ax.texts:
+            return
+        style = self.theme_style()
+        self.hover_annotation = self.ax.annotate(
+            "", xy=(0, 0), xytext=(12, 12), textcoords="offset points", animated=True, visible=False,
+            bbox={"boxstyle": "round", "facecolor": style["background"], "edgecolor": style["foreground"]},
+            color=style["foreground"])
+        self.hover_marker, = self.ax.plot([], [], "o", color=style["accent"], animated=True)
+        self.selected_marker, = self.ax.plot([], [], "o", markersize=12, fillstyle="none",
+                                             color=style["accent"], animated=True)
+
+    def on_draw(self, event):
+        """Caches the freshly drawn figure as the background for blitting."""
+        self.hover_background = self.canvas.copy_from_bbox(self.figure.bbox)
+        if self.selected_marker is not None and self.selected_marker in self.ax.lines:
+            self.ax.draw_artist(self.selected_marker)
+
+    def blit_hover(self):
+        """Redraws only the tooltip and markers over the cached background."""
+        if self.hover_background is None:
+            return
+        self.canvas.restore_region(self.hover_background)
+        for artist in (self.selected_marker, self.hover_marker, self.hover_annotation):
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+    def on_hover(self, event):
+        """Shows the value of the nearest data point under the mouse."""
+        if self.nav_toolbar.mode or self.income_data.empty or self.render_worker is not None:
+            return
+        self.ensure_hover_artists()
+        point = self.nearest_point(event) if event.inaxes is self.ax else None
+        if point is None:
+            if not self.hover_annotation.get_visible():
+                return
+            self.hover_annotation.set_visible(False)
+            self.hover_marker.set_data([], [])
+        else:
+            x, y, text = point
+            self.hover_annotation.xy = (x, y)
+            self.hover_annotation.set_text(text)
+            self.hover_annotation.set_visible(True)
+            self.hover_marker.set_data([x], [y])
+        self.blit_hover()
+
+    def on_click(self, event):
+        """Selects the data point nearest a left click."""
+        if self.nav_toolbar.mode or event.button != 1 or event.inaxes is not self.ax or self.income_data.empty:
+            return
+        self.ensure_hover_artists()
+        point = self.nearest_point(event)
+        if point is None:
+            self.selected_marker.set_data([], [])
+        else:
+            self.selected_marker.set_data([point[0]], [point[1]])
+        self.blit_hover()
+
+# LINKED GRAPH VIEWS
+    def open_graph_view(self):
+        """Opens a window to pick the type of an extra graph view."""
+        view_dialog = Toplevel(self.root)
+        view_dialog.title("New Graph View")
+        view_dialog.geometry("300x200")
+
+        Label(view_dialog, text="Select View Type:").pack(pady=20)
+
+        def open_view(graph_type):
+            self.graph_views.append(GraphView(self, graph_type))
+            view_dialog.destroy()
+
+        Button(view_dialog, text="Line Graph", command=lambda: open_view("line")).pack(pady=5)
+        Button(view_dialog, text="Bar Graph", command=lambda: open_view("bar")).pack(pady=5)
+        Button(view_dialog, text="Histogram", command=lambda: open_view("histogram")).pack(pady=5)
+
+    def data_replaced(self):
+        """Invalidates cached results and redraws the graph views after income_data was replaced."""
+        self.data_version += 1
+        self.rewrite_version = self.data_version
+        for view in self.graph_views:
+            view.redraw()
+
+    def watch_axes(self):
+        """Reconnects the main axes limit callbacks, which ax.clear() drops."""
+        self.ax.callbacks.connect("xlim_changed", self.on_xlim_changed)
+
+    def on_xlim_changed(self, ax):
+        """Mirrors an x-axis zoom/pan onto every other axes plotted against Period."""
+        if ax is self.ax and self.range_source is not None and not self.positional_x and self.graph_type != "histogram":
+            # Only a Period x-axis says which rows should be resident
+            self.schedule_range_refresh()
+        if self.linking_xlim:
+            return
+        linked_axes = [view.ax for view in self.graph_views if view.graph_type != "histogram"]
+        if self.graph_type in ("line", "line_with_dots"):
+            linked_axes.append(self.ax)
+        if ax not in linked_axes:
+            return
+
+        self.linking_xlim = True
+        try:
+            for other in linked_axes:
+                if other is not ax:
+                    other.set_xlim(ax.get_xlim())
+                    other.figure.canvas.draw_idle()
+        finally:
+            self.linking_xlim = False
+
+
+class RenderWorker:
+    """Owns the render process plus the shared-memory blocks for the data it draws and the frames it returns."""
+
+    def __init__(self):
+        context = multiprocessing.get_context("spawn")
+        self.requests = context.Queue()
+        self.results = context.Queue()
+        self.process = context.Process(target=render_worker_main, args=(self.requests, self.results), daemon=True)
+        self.process.start()
+        self.sequence = 0
+        self.data_block = None
+        self.data_key = None
+        self.data_rows = 0
+        self.data_dates = False
+        self.frame_block = None
+
+    def publish(self, data, key):
+        """Copies the Period, Amount and row index columns into shared memory once per data version and filter."""
+        if key == self.data_key:
+            return
+        self.release(self.data_block)
+        self.data_block = None
+        self.data_rows = len(data)
+        self.data_dates = pd.api.types.is_datetime64_any_dtype(data["Period"])
+        if self.data_rows:
+            self.data_block = shared_memory.SharedMemory(create=True, size=3 * 8 * self.data_rows)
+            columns = np.ndarray((3, self.data_rows), dtype=np.float64, buffer=self.data_block.buf)
+            if self.data_dates:
+                columns[0] = data["Period"].to_numpy("datetime64[ns]").view(np.int64).view(np.float64)
+            else:
+                columns[0] = pd.to_numeric(data["Period"], errors="coerce").to_numpy(np.float64)
+            columns[1] = data["Amount"].to_numpy(np.float64)
+            columns[2] = data.index.to_numpy(np.float64)
+        self.data_key = key
+
+    def submit(self, scene, data, key):
+        """Queues a scene; any request still waiting in the queue becomes stale."""
+        self.publish(data, key)
+        width, height = scene["size"]
+        if self.frame_block is None or self.frame_block.size < width * height * 4:
+            self.release(self.frame_block)
+            self.frame_block = shared_memory.SharedMemory(create=True, size=width * height * 4)
+
+        self.sequence += 1
+        scene.update(data=self.data_block.name if self.data_block else None, rows=self.data_rows,
+                     dates=self.data_dates, frame=self.frame_block.name)
+        self.requests.put((self.sequence, scene))
+
+    def latest_frame(self):
+        """Returns (width, height, pixels, xlim) of the newest request once rendered, discarding stale frames."""
+        newest = None
+        try:
+            while True:
+                newest = self.results.get_nowait()
+        except queue.Empty:
+            pass
+        if newest is None or newest[0] != self.sequence or newest[1] is None:
+            return None
+        sequence, width, height, xlim = newest
+        return width, height, bytes(self.frame_block.buf[:width * height * 4]), xlim
+
+    def release(self, block):
+        """Frees a shared-memory block this side created."""
+        if block is not None:
+            block.close()
+            block.unlink()
+
+    def close(self):
+        """Stops the render process and frees the shared memory."""
+        self.requests.put(None)
+        self.process.join(timeout=2)
+        self.release(self.data_block)
+        self.release(self.frame_block)
+
+
+class SQLiteLedgerSource:
+    """Pages Period/Amount rows of a SQLite ledger table in, one Period range at a time."""
+
+    PAGE_SIZE = 50000
+    MAX_ROWS = 500000
+    INITIAL_ROWS = 10000
+    PREFETCH = 0.5
+
+    # Connections are shared by every source opened on the same database
+    connections = {}
+
+    def __init__(self, path, table):
+        self.connection = self.connect(path)
+        self.table = '"' + table.replace('"', '""') + '"'
+        self.indexed = self.has_period_index() or self.create_period_index(table)
+
+        first = self.connection.execute(f"SELECT Period FROM {self.table} WHERE Period IS NOT NULL LIMIT 1").fetchone()
+        self.kind = "number" if first is not None and isinstance(first[0], (int, float)) else "date"
+        self.date_separator = "T" if first is not None and isinstance(first[0], str) and "T" in first[0] else " "
+
+    @classmethod
+    def connect(cls, path):
+        """Returns the pooled connection for a database, opening it on first use."""
+        path = os.path.abspath(path)
+        if path not in cls.connections:
+            cls.connections[path] = sqlite3.connect(path)
+        return cls.connections[path]
+
+    def has_period_index(self):
+        """Returns whether an existing index of the table starts with the Period column."""
+        for index in self.connection.execute(f"PRAGMA index_list({self.table})").fetchall():
+            name = '"' + index[1].replace('"', '""') + '"'
+            columns = self.connection.execute(f"PRAGMA index_info({name})").fetchall()
+            if columns and columns[0][2] == "Period":
+                return True
+        return False
+
+    def create_period_index(self, table):
+        """Adds a Period index so range queries stay fast, returning False if the database cannot be written."""
+        index = '"' + f"idx_{table}_period".replace('"', '""') + '"'
+        try:
+            self.connection.execute(f"CREATE INDEX {index} ON {self.table} (Period)")
+            self.connection.commit()
+            return True
+        except sqlite3.OperationalError:
+            # Read-only or locked; range queries still work, just by scanning the table
+            self.connection.rollback()
+            return False
+
+    @classmethod
+    def tables(cls, path):
+        """Lists the tables of a database."""
+        rows = cls.connect(path).execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")
+        return [name for name, in rows if not name.startswith("sqlite_")]
+
+    def initial_range(self):
+        """Returns the Period range holding the most recent INITIAL_ROWS rows."""
+        low = self.connection.execute(
+            f"SELECT Period FROM {self.table} WHERE Period IS NOT NULL ORDER BY Period DESC LIMIT 1 OFFSET ?",
+            (self.INITIAL_ROWS,)).fetchone()
+        high = self.connection.execute(f"SELECT MAX(Period) FROM {self.table}").fetchone()
+        if low is None:
+            low = self.connection.execute(f"SELECT MIN(Period) FROM {self.table}").fetchone()
+        return self.to_period(low[0]), self.to_period(high[0])
+
+    def to_period(self, value):
+        """Converts a stored or plotted Period value into a comparable Timestamp or number."""
+        if self.kind == "date":
+            return pd.Timestamp(value)
+        return float(value)
+
+    def level(self, low, high):
+        """Returns the level of detail a visible range is drawn at; a ledger always serves raw rows."""
+        return "rows"
+
+    def covers(self, loaded, low, high):
+        """Returns whether the loaded Period range already holds low to high."""
+        return loaded[0] <= low and high <= loaded[1]
+
+    def to_sql(self, value, lower=False):
+        """Converts a Period bound into a query parameter that compares correctly against the stored text.
+
+        A date stored without a time sorts before the same day at midnight, so a midnight lower bound is
+        sent as the bare date.
+        """
+        if self.kind == "date":
+            if lower and value == value.normalize():
+                return value.strftime("%Y-%m-%d")
+            return value.isoformat(sep=self.date_separator)
+        return value
+
+    def fetch(self, low, high, level="rows"):
+        """Reads the rows with low <= Period <= high page by page, stopping at MAX_ROWS.
+
+        Returns the rows and whether the whole range fitted under the cap.
+        """
+        low, high = self.to_sql(low, lower=True), self.to_sql(high)
+        query = f"SELECT rowid, Period, Amount FROM {self.table} WHERE Period >= ? AND Period <= ? ORDER BY Period, rowid LIMIT ?"
+        next_query = (f"SELECT rowid, Period, Amount FROM {self.table} WHERE (Period > ? OR (Period = ? AND rowid > ?)) "
+                      f"AND Period <= ? ORDER BY Period, rowid LIMIT ?")
+
+        pages = []
+        total = 0
+        page = self.connection.execute(query, (low, high, self.PAGE_SIZE)).fetchall()
+        while page:
+            pages.append(pd.DataFrame(page, columns=["rowid", "Period", "Amount"]))
+            total += len(page)
+            if len(page) < self.PAGE_SIZE or total >= self.MAX_ROWS:
+                break
+            # Keyset pagination: continue after the last (Period, rowid) seen
+            last_id, last_period, _ = page[-1]
+            page = self.connection.execute(next_query, (last_period, last_period, last_id, high, self.PAGE_SIZE)).fetchall()
+
+        if not pages:
+            return pd.DataFrame(columns=["Period", "Amount"]), True
+        return pd.concat(pages, ignore_index=True).drop(columns="rowid"), total < self.MAX_ROWS
+
+
+class ChunkedStore:
+    """A time-partitioned on-disk store: one pair of memory-mapped Period/Amount column files per month,
+    daily summaries per month for overview zoom levels, and a small JSON index."""
+
+    MAX_RESIDENT = 16
+    OVERVIEW_CHUNKS = 6
+    PREFETCH = 0.5
+    kind = "date"
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "index.json")) as index_file:
+            self.chunks = json.load(index_file)["chunks"]
+        self.starts = np.array([chunk["start"] for chunk in self.chunks], dtype="datetime64[ns]")
+        self.ends = np.array([chunk["end"] for chunk in self.chunks], dtype="datetime64[ns]")
+        self.resident = OrderedDict()
+        self.summaries = {}
+
+    @classmethod
+    def write(cls, directory, data):
+        """Partitions data by month and writes every chunk, its summary and the index."""
+        periods = data["Period"]
+        if not pd.api.types.is_datetime64_any_dtype(periods):
+            if pd.api.types.is_numeric_dtype(periods):
+                raise ValueError("the Period column must hold dates")
+            periods = pd.to_datetime(periods, errors="coerce")
+            if periods.isna().any():
+                raise ValueError("the Period column must hold dates")
+        periods = periods.to_numpy("datetime64[ns]")
+        amounts = data["Amount"].to_numpy(np.float64)
+        order = np.argsort(periods, kind="stable")
+        periods, amounts = periods[order], amounts[order]
+
+        months = periods.astype("datetime64[M]")
+        bounds = np.r_[np.flatnonzero(np.r_[True, months[1:] != months[:-1]]), len(months)] if len(months) else []
+        chunks = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            name = str(months[start])
+            days = periods[start:end].astype("datetime64[D]")
+            day_starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+            cls.save_array(directory, f"{name}.period.npy", periods[start:end].view(np.int64))
+            cls.save_array(directory, f"{name}.amount.npy", amounts[start:end])
+            cls.save_array(directory, f"{name}.daily_period.npy", days[day_starts].astype("datetime64[ns]").view(np.int64))
+            cls.save_array(directory, f"{name}.daily_amount.npy", np.add.reduceat(amounts[start:end], day_starts))
+            chunks.append({"month": name, "rows": int(end - start),
+                           "start": str(periods[start]), "end": str(periods[end - 1])})
+
+        # The index goes last so a partially written store is never opened
+        temp_path = os.path.join(directory, "index.json.tmp")
+        with open(temp_path, "w") as index_file:
+            json.dump({"chunks": chunks}, index_file, indent=2)
+        os.replace(temp_path, os.path.join(directory, "index.json"))
+
+    @staticmethod
+    def save_array(directory, name, array):
+        """Writes one column file atomically."""
+        temp_path = os.path.join(directory, name + ".tmp")
+        with open(temp_path, "wb") as column_file:
+            np.save(column_file, array)
+        os.replace(temp_path, os.path.join(directory, name))
+
+    def initial_range(self):
+        """Returns the full Period range of the store, shown as an overview."""
+        if not self.chunks:
+            raise ValueError("The chunk store is empty.")
+        return pd.Timestamp(self.starts[0]), pd.Timestamp(self.ends[-1])
+
+    def to_period(self, value):
+        """Converts a Period value into a Timestamp."""
+        return pd.Timestamp(value)
+
+    def intersecting(self, low, high):
+        """Returns the indices of the chunks overlapping low to high."""
+        return np.flatnonzero((self.ends >= np.datetime64(low)) & (self.starts <= np.datetime64(high)))
+
+    def level(self, low, high):
+        """Returns "daily" when a visible range spans enough chunks to be drawn from daily summaries."""
+        return "daily" if len(self.intersecting(low, high)) > self.OVERVIEW_CHUNKS else "rows"
+
+    def covers(self, loaded, low, high):
+        """Returns whether the loaded range holds low to high at the level of detail it needs."""
+        return loaded[0] <= low and high <= loaded[1] and self.level(low, high) == loaded[2]
+
+    def chunk(self, index):
+        """Returns the memory-mapped columns of a chunk, keeping at most MAX_RESIDENT chunks mapped."""
+        month = self.chunks[index]["month"]
+        if month in self.resident:
+            self.resident.move_to_end(month)
+        else:
+            self.resident[month] = (
+                np.load(os.path.join(self.directory, f"{month}.period.npy"), mmap_mode="r"),
+                np.load(os.path.join(self.directory, f"{month}.amount.npy"), mmap_mode="r"),
+            )
+            if len(self.resident) > self.MAX_RESIDENT:
+                self.resident.popitem(last=False)
+        return self.resident[month]
+
+    def summary(self, index):
+        """Returns the daily Period/Amount totals of a chunk."""
+        month = self.chunks[index]["month"]
+        if month not in self.summaries:
+            self.summaries[month] = (
+                np.load(os.path.join(self.directory, f"{month}.daily_period.npy")),
+                np.load(os.path.join(self.directory, f"{month}.daily_amount.npy")),
+            )
+        return self.summaries[month]
+
+    def fetch(self, low, high, level="rows"):
+        """Returns raw rows between low and high, or daily totals at the "daily" level."""
+        indices = self.intersecting(low, high)
+        read = self.summary if level == "daily" else self.chunk
+        low, high = np.datetime64(low, "ns").view(np.int64), np.datetime64(high, "ns").view(np.int64)
+
+        periods, amounts = [], []
+        for index in indices:
+            chunk_periods, chunk_amounts = read(index)
+            start = np.searchsorted(chunk_periods, low, side="left")
+            end = np.searchsorted(chunk_periods, high, side="right")
+            periods.append(chunk_periods[start:end])
+            amounts.append(chunk_amounts[start:end])
+
+        if not periods:
+            return pd.DataFrame(columns=["Period", "Amount"]), True
+        return pd.DataFrame({"Period": np.concatenate(periods).view("datetime64[ns]"),
+                             "Amount": np.concatenate(amounts)}), True
+
+
+class ForecastEngine:
+    """Fits linear trend and Holt-Winters models to the Amount series. Fitted state is cached per key
+    and data version, and appended observations are folded into it instead of refitting."""
+
+    Z = 1.96
+    MAX_FIT_ROWS = 5000
+    ALPHAS = (0.1, 0.3, 0.5, 0.7, 0.9)
+    BETAS = (0.01, 0.1, 0.3)
+    GAMMAS = (0.05, 0.2, 0.5)
+
+    def __init__(self):
+        self.models = {}
+
+    def forecast(self, key, method, amounts, season, version, rewrite_version, horizon):
+        """Returns (mean, lower, upper) arrays for the next horizon periods."""
+        key = key + (season,)
+        cached = self.models.get(key)
+        if cached is not None and cached[0] == version:
+            state = cached[2]
+        elif cached is not None and cached[0] >= rewrite_version and cached[1] <= len(amounts):
+            state = self.update(method, cached[2], amounts[cached[1]:])
+        else:
+            state = self.fit(method, amounts, season)
+        self.models[key] = (version, len(amounts), state)
+        return self.project(method, state, horizon)
+
+    def fit(self, method, amounts, season):
+        """Fits a model from scratch."""
+        if method == "linear":
+            empty = {"n": 0, "sx": 0.0, "sy": 0.0, "sxx": 0.0, "sxy": 0.0, "syy": 0.0}
+            return self.update(method, empty, amounts)
+
+        values = amounts[-self.MAX_FIT_ROWS:]
+        if season > 1 and len(values) >= 2 * season:
+            level = values[:season].mean()
+            trend = (values[season:2 * season].mean() - level) / season
+            start = {"level": level, "trend": trend, "seasonals": values[:season] - level, "t": season}
+        else:
+            season = 1
+            start = {"level": values[0], "trend": values[1] - values[0], "seasonals": np.zeros(1), "t": 1}
+        start.update(season=season, sse=0.0, errors=0)
+
+        # Grid search the smoothing parameters by one-step-ahead squared error
+        best = None
+        for alpha in self.ALPHAS:
+            for beta in self.BETAS:
+                for gamma in (self.GAMMAS if season > 1 else (0.0,)):
+                    state = self.smooth(dict(start, alpha=alpha, beta=beta, gamma=gamma), values[start["t"]:])
+                    if best is None or state["sse"] < best["sse"]:
+                        best = state
+        return best
+
+    def update(self, method, state, values):
+        """Folds new observations into a fitted state."""
+        if method == "holt_winters":
+            return self.smooth(state, values)
+        x = np.arange(state["n"], state["n"] + len(values), dtype=np.float64)
+        return {
+            "n": state["n"] + len(values),
+            "sx": state["sx"] + x.sum(), "sy": state["sy"] + values.sum(),
+            "sxx": state["sxx"] + (x * x).sum(), "sxy": state["sxy"] + (x * values).sum(),
+            "syy": state["syy"] + (values * values).sum(),
+        }
+
+    def smooth(self, state, values):
+        """Runs the additive Holt-Winters recursion over values, starting from state."""
+        alpha, beta, gamma, season = state["alpha"], state["beta"], state["gamma"], state["season"]
+        level, trend, seasonals = state["level"], state["trend"], state["seasonals"].copy()
+        t, sse = state["t"], state["sse"]
+        for value in values:
+            seasonal = seasonals[t % season]
+            error = value - (level + trend + seasonal)
+            sse += error * error
+            new_level = alpha * (value - seasonal) + (1 - alpha) * (level + trend)
+            trend = beta * (new_level - level) + (1 - beta) * trend
+            seasonals[t % season] = gamma * (value - new_level) + (1 - gamma) * seasonal
+            level = new_level
+            t += 1
+        return dict(state, level=level, trend=trend, seasonals=seasonals, t=t, sse=sse,
+                    errors=state["errors"] + len(values))
+
+    def project(self, method, state, horizon):
+        """Extrapolates a fitted state with a confidence band."""
+        steps = np.arange(1, horizon + 1)
+        if method == "holt_winters":
+            mean = state["level"] + steps * state["trend"] + state["seasonals"][(state["t"] + steps - 1) % state["season"]]
+            sigma = np.sqrt(state["sse"] / max(state["errors"], 1))
+            spread = self.Z * sigma * np.sqrt(steps)
+            return mean, mean - spread, mean + spread
+
+        n = state["n"]
+        x_mean, y_mean = state["sx"] / n, state["sy"] / n
+        sxx = state["sxx"] - n * x_mean * x_mean
+        sxy = state["sxy"] - n * x_mean * y_mean
+        syy = state["syy"] - n * y_mean * y_mean
+        slope = sxy / sxx
+        intercept = y_mean - slope * x_mean
+        sigma = np.sqrt(max(syy - slope * sxy, 0.0) / max(n - 2, 1))
+
+        x = n - 1 + steps
+        mean = intercept + slope * x
+        spread = self.Z * sigma * np.sqrt(1 + 1 / n + (x - x_mean) ** 2 / sxx)
+        return mean, mean - spread, mean + spread
+
+
+class PeriodAggregator:
+    """Totals Amount per calendar month or quarter with one vectorized groupby, caching the groups per key
+    and data version so appended rows only touch the groups they fall in."""
+
+    # Comparison mode: (grouping, how many groups back the earlier period is, legend labels)
+    MODES = {
+        "yoy": ("month", 12, ("This month", "Same month last year")),
+        "qoq": ("quarter", 1, ("This quarter", "Previous quarter")),
+        "mom": ("month", 1, ("This month", "Previous month")),
+    }
+
+    def __init__(self):
+        self.cache = {}
+
+    def aggregate(self, data, key, version, rewrite_version):
+        """Returns sum and count per group for key, grouping only appended rows when older groups are cached."""
+        grouping = key[0]
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[2]
+
+        if cached is not None and cached[0] >= rewrite_version and cached[1] <= len(data):
+            groups = cached[2]
+            if cached[1] < len(data):
+                new_groups = self.compute(data.iloc[cached[1]:], grouping)
+                groups = groups.add(new_groups, fill_value=0).astype({"sum": np.float64, "count": np.int64})
+        else:
+            groups = self.compute(data, grouping)
+
+        self.cache[key] = (version, len(data), groups)
+        return groups
+
+    def compute(self, data, grouping):
+        """Groups rows by the calendar month or quarter of their Period."""
+        periods = data["Period"]
+        if not pd.api.types.is_datetime64_any_dtype(periods):
+            if pd.api.types.is_numeric_dtype(periods):
+                raise ValueError("the Period column must hold dates")
+            periods = pd.to_datetime(periods, errors="coerce")
+            if periods.isna().any():
+                raise ValueError("the Period column must hold dates")
+        buckets = periods.dt.to_period("M" if grouping == "month" else "Q")
+        frame = pd.DataFrame({"Bucket": buckets.array, "Amount": data["Amount"].to_numpy(np.float64)})
+        return frame.groupby("Bucket")["Amount"].agg(["sum", "count"])
+
+    def compare(self, groups, lag):
+        """Returns each group's total and the total lag groups earlier, NaN where that group has no rows."""
+        current = groups["sum"]
+        prior = current.reindex(current.index - lag)
+        return current.to_numpy(), prior.to_numpy()
+
+
+class CandleResampler:
+    """Resamples raw Period/Amount ticks into daily or weekly OHLC bars with one sort and reduceat,
+    caching the bars per key and data version."""
+
+    def __init__(self):
+        self.cache = {}
+
+    def resample(self, data, key, version, rewrite_version):
+        """Returns OHLC bars for key, resampling only appended ticks when older bars are cached."""
+        interval = key[0]
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[3]
+
+        periods, amounts = self.ticks(data)
+        if cached is not None and cached[0] >= rewrite_version and cached[1] <= len(data):
+            # Only ticks were appended; merge them in if they do not reach back before the cached bars end
+            start = cached[1]
+            if start == len(data):
+                bars = cached[3]
+            elif periods[start:].min() >= cached[2]:
+                bars = self.merge(cached[3], self.compute(periods[start:], amounts[start:], interval))
+            else:
+                bars = self.compute(periods, amounts, interval)
+        else:
+            bars = self.compute(periods, amounts, interval)
+
+        last_tick = periods.max() if len(periods) else np.datetime64("NaT")
+        self.cache[key] = (version, len(data), last_tick, bars)
+        return bars
+
+    def ticks(self, data):
+        """Returns the Period column as datetime64 and Amount as float64."""
+        periods = data["Period"]
+        if not pd.api.types.is_datetime64_any_dtype(periods):
+            periods = pd.to_datetime(periods, errors="coerce")
+            if periods.isna().any():
+                raise ValueError("the Period column must hold dates")
+        return periods.to_numpy("datetime64[ns]"), data["Amount"].to_numpy(np.float64)
+
+    def compute(self, periods, amounts, interval):
+        """Builds Open/High/Low/Close/Volume bars for the given ticks."""
+        order = np.argsort(periods, kind="stable")
+        periods, amounts = periods[order], amounts[order]
+
+        buckets = periods.astype("datetime64[D]")
+        if interval == "week":
+            # Weeks start on Monday; day 0 (1970-01-01) was a Thursday
+            day_numbers = buckets.astype(np.int64)
+            buckets = (day_numbers - (day_numbers + 3) % 7).astype("datetime64[D]")
+
+        if not len(buckets):
+            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"], index=pd.DatetimeIndex([], name="Date"))
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(buckets)] - 1
+        return pd.DataFrame({
+            "Open": amounts[starts],
+            "High": np.maximum.reduceat(amounts, starts),
+            "Low": np.minimum.reduceat(amounts, starts),
+            "Close": amounts[ends],
+            "Volume": np.add.reduceat(np.abs(amounts), starts),
+        }, index=pd.DatetimeIndex(buckets[starts], name="Date"))
+
+    def merge(self, bars, new_bars):
+        """Appends bars built from later ticks, folding a shared first bucket into the last cached bar."""
+        if bars.empty:
+            return new_bars
+        if new_bars.index[0] == bars.index[-1]:
+            last, first = bars.iloc[-1], new_bars.iloc[0]
+            joined = pd.DataFrame({
+                "Open": [last["Open"]],
+                "High": [max(last["High"], first["High"])],
+                "Low": [min(last["Low"], first["Low"])],
+                "Close": [first["Close"]],
+                "Volume": [last["Volume"] + first["Volume"]],
+            }, index=bars.index[-1:])
+            return pd.concat([bars.iloc[:-1], joined, new_bars.iloc[1:]])
+        return pd.concat([bars, new_bars])
+
+
+class FilterEngine:
+    """Compiles filter expressions such as "Amount > 1000 and Period >= 2024-01" into vectorized
+    NumPy operations over the columns, caching one boolean mask per expression and data version."""
+
+    COMPARISONS = {
+        ast.Gt: np.greater, ast.GtE: np.greater_equal, ast.Lt: np.less, ast.LtE: np.less_equal,
+        ast.Eq: np.equal, ast.NotEq: np.not_equal,
+        ast.In: np.isin, ast.NotIn: lambda left, right: ~np.isin(left, right),
+    }
+    DATE_LITERAL = re.compile(r"(?<![\w\"'])(\d{4}-\d{2}(?:-\d{2})?)(?![\w\"'-])")
+    MAX_CACHED_MASKS = 16
+
+    def __init__(self):
+        self.compiled = {}
+        self.masks = {}
+
+    def mask(self, expression, data, version, rewrite_version):
+        """Returns the mask for expression, evaluating only appended rows when an older mask is cached."""
+        cached = self.masks.get(expression)
+        if cached is not None and cached[0] == version:
+            return cached[2]
+
+        evaluate = self.compile(expression)
+        if cached is not None and cached[0] >= rewrite_version and cached[1] <= len(data):
+            # Rows were only appended since the cached mask, so extend it with the tail
+            mask = np.concatenate([cached[2], self.evaluate(evaluate, data, cached[1])])
+        else:
+            mask = self.evaluate(evaluate, data, 0)
+
+        self.masks.pop(expression, None)
+        self.masks[expression] = (version, len(data), mask)
+        if len(self.masks) > self.MAX_CACHED_MASKS:
+            del self.masks[next(iter(self.masks))]
+        return mask
+
+    def evaluate(self, evaluate, data, start):
+        """Runs a compiled expression over the rows of data from index start."""
+        columns = {}
+
+        def column(name):
+            if name not in columns:
+                matches = [c for c in data.columns if str(c).lower() == name.lower()]
+                if not matches:
+                    raise ValueError(f"Unknown column '{name}'")
+                columns[name] = data[matches[0]].to_numpy()[start:]
+            return columns[name]
+
+        result = np.asarray(evaluate(column), dtype=bool)
+        return np.broadcast_to(result, (len(data) - start,))
+
+    def compile(self, expression):
+        """Parses an expression once into a function of a column lookup."""
+        if expression not in self.compiled:
+            # Quote bare dates like 2024-01 so they are not parsed as subtraction
+            source = self.DATE_LITERAL.sub(r'"\1"', expression)
+            tree = ast.parse(source, mode="eval")
+            self.compiled[expression] = self.build(tree.body)
+        return self.compiled[expression]
+
+    def build(self, node):
+        """Turns one syntax tree node into a vectorized function."""
+        if isinstance(node, ast.BoolOp):
+            parts = [self.build(value) for value in node.values]
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            return lambda column: combine.reduce([part(column) for part in parts])
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self.build(node.operand)
+            return lambda column: np.logical_not(operand(column))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand = self.build(node.operand)
+            sign = np.negative if isinstance(node.op, ast.USub) else np.positive
+            return lambda column: sign(operand(column))
+        if isinstance(node, ast.Compare):
+            operands = [self.build(operand) for operand in [node.left] + node.comparators]
+            operators = [self.COMPARISONS[type(op)] for op in node.ops]
+
+            def compare(column):
+                values = [operand(column) for operand in operands]
+                result = True
+                for operator, left, right in zip(operators, values, values[1:]):
+                    result = np.logical_and(result, operator(*self.align(left, right)))
+                return result
+            return compare
+        if isinstance(node, ast.Name):
+            return lambda column: column(node.id)
+        if isinstance(node, ast.Constant):
+            return lambda column: node.value
+        if isinstance(node, (ast.Tuple, ast.List)):
+            elements = [self.build(element) for element in node.elts]
+            return lambda column: [element(column) for element in elements]
+        raise ValueError(f"Unsupported filter syntax: {ast.unparse(node)}")
+
+    def align(self, left, right):
+        """Converts date strings so they compare against date columns."""
+        def is_date(value):
+            return isinstance(value, str) and self.DATE_LITERAL.fullmatch(value) is not None
+
+        def as_dates(values):
+            if np.issubdtype(values.dtype, np.datetime64):
+                return values
+            return pd.to_datetime(values, errors="coerce").to_numpy()
+
+        if is_date(right) and isinstance(left, np.ndarray):
+            return as_dates(left), pd.Timestamp(right).to_datetime64()
+        if is_date(left) and isinstance(right, np.ndarray):
+            return pd.Timestamp(left).to_datetime64(), as_dates(right)
+        if isinstance(right, list) and isinstance(left, np.ndarray) and any(is_date(value) for value in right):
+            return as_dates(left), pd.to_datetime(right, errors="coerce").to_numpy()
+        return left, right
+
+
+class GraphView:
+    """A read-only graph window drawing the app's income data without keeping its own copy."""
+
+    def __init__(self, app, graph_type):
+        self.app = app
+        self.graph_type = graph_type
+
+        self.window = Toplevel(app.root)
+        self.window.title(f"OpenUtopia Finance - {graph_type.title()} View")
+        self.window.geometry("800x600")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.figure = Figure()
+        self.ax = self.figure.add_subplot()
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.window)
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.nav_toolbar = NavigationToolbar2Tk(self.canvas, self.window)
+        self.nav_toolbar.update()
+
+        self.redraw()
+
+    def columns(self, start=0):
+        """Returns the shared Period and Amount arrays from row start, restricted to the active filter."""
+        data = self.app.income_data
+        periods = data["Period"].to_numpy(copy=False)[start:]
+        amounts = data["Amount"].to_numpy(copy=False)[start:]
+        mask = self.app.filter_mask()
+        if mask is not None:
+            periods, amounts = periods[mask[start:]], amounts[mask[start:]]
+        return periods, amounts
+
+    def redraw(self):
+        """Rebuilds the view's artists from the full income data."""
+        self.ax.clear()
+        self.ax.callbacks.connect("xlim_changed", self.app.on_xlim_changed)
+        periods, amounts = self.columns()
+        color = self.app.theme_style()["series"]
+        self.line = self.bin_edges = self.bins = None
+
+        if len(amounts):
             if self.graph_type == "line":
-                self.income_data.plot(x="Period", y="Amount", ax=self.ax, legend=False)
-            elif self.graph_type == "line_with_dots":
-                self.income_data.plot(x="Period", y="Amount", marker="o", ax=self.ax, legend=False)
+                self.line, = self.ax.plot(periods, amounts, color=color, gid="series")
             elif self.graph_type == "bar":
-                self.income_data.plot(kind="bar", x="Period", y="Amount", ax=self.ax, legend=False)
+                self.ax.bar(periods, amounts, color=color, gid="series")
             elif self.graph_type == "histogram":
-                self.ax.hist(self.income_data["Amount"], bins=10)
-            elif self.graph_type == "spline":
-                from scipy.interpolate import make_interp_spline
-                import numpy as np
-                periods = np.array(self.income_data["Period"].index.values, dtype=float)  
-                amounts = np.array(self.income_data["Amount"])
-                spline = make_interp_spline(periods, amounts)
-                smoothed_periods = np.linspace(periods.min(), periods.max(), 500)
-                smoothed_amounts = spline(smoothed_periods)
-                self.ax.plot(smoothed_periods, smoothed_amounts, color='green')
-        self.ax.set_title("Income Data")
-        self.ax.set_xlabel("Period")
-        self.ax.set_ylabel("Amount")
-        self.canvas.draw()
+                counts, self.bin_edges = np.histogram(amounts.astype(float), bins=10)
+                self.bins = self.ax.bar(self.bin_edges[:-1], counts, width=np.diff(self.bin_edges), align="edge",
+                                        color=color, gid="series")
+
+        self.ax.set_title(f"Income Data ({self.graph_type.title()})")
+        self.ax.set_xlabel("Amount" if self.graph_type == "histogram" else "Period")
+        self.ax.set_ylabel("Count" if self.graph_type == "histogram" else "Amount")
+        self.app.style_axes(self.ax)
+        self.canvas.draw_idle()
+
+    def extend(self, start):
+        """Draws only the rows appended from index start onwards."""
+        if start == 0:
+            self.redraw()
+            return
+        new_periods, new_amounts = self.columns(start)
+        if not len(new_amounts):
+            return
+        new_amounts = new_amounts.astype(float)
+        if (self.graph_type == "line" and self.line is None) or (self.graph_type == "histogram" and self.bins is None):
+            # The last redraw had no rows to draw, so there are no artists to extend
+            self.redraw()
+            return
+
+        if self.graph_type == "line":
+            self.line.set_data(*self.columns())
+        elif self.graph_type == "bar":
+            self.ax.bar(new_periods, new_amounts, color=self.app.theme_style()["series"], gid="series")
+        elif self.graph_type == "histogram":
+            if new_amounts.min() < self.bin_edges[0] or new_amounts.max() > self.bin_edges[-1]:
+                # New values fall outside the current bins, so the bins themselves change
+                self.redraw()
+                return
+            new_counts, _ = np.histogram(new_amounts, bins=self.bin_edges)
+            for patch, count in zip(self.bins, new_counts):
+                patch.set_height(patch.get_height() + count)
+
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.canvas.draw_idle()
+
+    def close(self):
+        """Closes the window and stops receiving updates."""
+        self.app.graph_views.remove(self)
+        self.window.destroy()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = OpenUtopiaFinanceApp(root)
     root.mainloop()
@@ -0,0 +1,111 @@
+'''
+Benchmark: parallel byte-range CSV ingestion against the single-threaded pd.read_csv path.
+
+Usage: python bench_ingest.py [rows]
+Writes a synthetic Period/Amount/Category CSV to a temporary folder, then times both readers.
+open_file offers the parallel path for CSVs of at least PARALLEL_CSV_BYTES in OpenUtopia.py on multi-core
+machines; run this on the target machine to check that size against the measured crossover.
+'''
+
+import os
+import sys
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+from OpenUtopia import read_csv_parallel
+
+
+def write_sample(file_path, rows):
+    """Writes a CSV of minute-spaced periods with random amounts and a label column."""
+    periods = pd.date_range("2015-01-01", periods=rows, freq="min")
+    amounts = np.round(np.random.default_rng(0).normal(1000, 250, rows), 2)
+    labels = np.random.default_rng(1).choice(["Salary", "Rent", "Food", "Travel"], rows)
+    pd.DataFrame({"Period": periods, "Amount": amounts, "Category": labels}).to_csv(file_path, index=False)
+
+
+def same_labels(result, expected):
+    """Returns whether two label columns hold the same values, treating missing values as equal."""
+    result, expected = result.astype(object).to_numpy(), expected.astype(object).to_numpy()
+    return all(left == right or (pd.isna(left) and pd.isna(right)) for left, right in zip(result, expected))
+
+
+def check_ranges(directory):
+    """Checks range splitting and label merging on small files whose ranges differ in what they hold."""
+    rows = 4000
+    first_half = np.arange(rows) < rows // 2
+    data = pd.DataFrame({
+        "Period": pd.date_range("2024-01-01", periods=rows, freq="h"),
+        "Amount": np.arange(rows) / 4,
+        # The first ranges hold only labels that look like numbers
+        "Category": np.where(first_half, "401", "Rent"),
+        # Empty in the first ranges, text in the later ones
+        "Note": pd.Series(np.where(first_half, None, "paid"), dtype=object),
+        # Numbers everywhere, so the regular path drops it
+        "Code": np.arange(rows) % 3,
+    })
+    file_path = os.path.join(directory, "ranges.csv")
+    data.to_csv(file_path, index=False)
+    expected = pd.read_csv(file_path)
+    result = read_csv_parallel(file_path, workers=2)
+    assert list(result.columns) == ["Period", "Amount", "Category", "Note"]
+    assert np.array_equal(result["Amount"].to_numpy(), expected["Amount"].to_numpy())
+    assert same_labels(result["Category"], expected["Category"])
+    assert same_labels(result["Note"], expected["Note"])
+
+    data["Period"] = data["Period"].astype(str)
+    data.loc[rows - 1, "Period"] = "not a date"
+    data.to_csv(file_path, index=False)
+    try:
+        read_csv_parallel(file_path, workers=2)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("an unparseable Period was not rejected")
+
+    with open(file_path, "w") as csv_file:
+        csv_file.write("Period,Amount,Category\n")
+    result = read_csv_parallel(file_path, workers=2)
+    assert result.empty and list(result.columns) == ["Period", "Amount"]
+
+
+def time_call(function, *args, **kwargs):
+    """Returns the best wall time of three runs and the last result."""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def read_csv_baseline(file_path):
+    """The existing open_file path: pd.read_csv plus typing the Period column."""
+    data = pd.read_csv(file_path)
+    data["Period"] = pd.to_datetime(data["Period"])
+    return data
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        check_ranges(directory)
+        print("range checks passed")
+
+        file_path = os.path.join(directory, "income.csv")
+        write_sample(file_path, rows)
+        size_mb = os.path.getsize(file_path) / 1024 / 1024
+        print(f"{rows:,} rows, {size_mb:.0f} MB")
+
+        baseline, expected = time_call(read_csv_baseline, file_path)
+        print(f"{'pd.read_csv':>16}: {baseline:6.2f} s")
+
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            elapsed, result = time_call(read_csv_parallel, file_path, workers=workers)
+            assert len(result) == len(expected)
+            assert np.array_equal(result["Amount"].to_numpy(), expected["Amount"].to_numpy())
+            assert (result["Category"].astype(str) == expected["Category"]).all()
+            print(f"{f'{workers} worker(s)':>16}: {elapsed:6.2f} s  ({baseline / elapsed:.1f}x)")
+            workers *= 2